@@ -10,6 +10,7 @@ and initializes authentication mechanisms.
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 from .socketio import socketio
+from .json_provider import OrjsonProvider
 from app.routes import (
     projects_bp,
     issues_bp,
@@ -22,6 +23,7 @@ from app.routes import (
 
 def create_app() -> Flask:
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     CORS(app, supports_credentials=True, expose_headers=["New-Access-Token"])
     socketio.init_app(app)
 
@@ -0,0 +1,10 @@
+"""Shared application extensions.
+
+Route modules import these instances instead of building their own, so every
+blueprint authenticates through the same managers and shares their caches.
+"""
+
+from app.utils.auth import TokenManager, AuthManager
+
+token_manager = TokenManager()
+auth_manager = AuthManager(token_manager)
@@ -0,0 +1,52 @@
+"""JSON provider backed by orjson.
+
+Serializes responses with orjson while keeping the output of Flask's default provider:
+dates as HTTP dates, decimals as strings, sorted keys and a trailing newline.
+"""
+
+import decimal
+from datetime import date
+from typing import Any
+import orjson
+from flask import Response
+from flask.json.provider import JSONProvider
+from werkzeug.http import http_date
+
+
+def _default(o: Any) -> Any:
+    if isinstance(o, date):
+        return http_date(o)
+
+    if isinstance(o, decimal.Decimal):
+        return str(o)
+
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    sort_keys = True
+    mimetype = "application/json"
+
+    def _options(self, indent: bool = False) -> int:
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=_default, option=self._options()).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(
+            obj, default=_default, option=self._options(indent=self._app.debug)
+        )
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
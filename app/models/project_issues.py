@@ -6,13 +6,14 @@ resolution status, and deleting records. Each function is decorated to ensure pr
 database connection context for reading or writing.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, Optional, List
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, List, Tuple
 from db import db_read_connection, db_write_connection
 from app.utils import (
-    fetch_errors_by_project,
-    fetch_rejections_by_project,
+    fetch_issue_page,
     calculate_total_error_pages,
+    count_pages,
+    PROJECT_ACCESS_PREDICATE,
 )
 
 
@@ -22,31 +23,47 @@ def fetch_issues_by_project(
     page: int,
     limit: int,
     handled: Optional[bool],
-    time: Optional[str],
+    time: Optional[datetime],
     resolved: Optional[bool],
+    after: Optional[Tuple[datetime, str]] = None,
     **kwargs: dict
 ) -> Dict[str, List[Dict[str, int]]]:
-    """Retrieves a paginated list of issues (errors and rejections) for a project."""
+    """Retrieves a paginated list of issues (errors and rejections) for a project.
+
+    Pass the `created_at` and `uuid` of the last issue from the previous page as
+    `after` to seek to the next page instead of offsetting to `page`.
+    """
     cursor = kwargs["cursor"]
 
-    errors = fetch_errors_by_project(
-        cursor, project_uuid, page, limit, handled, time, resolved
-    )
-    rejections = fetch_rejections_by_project(
-        cursor, project_uuid, page, limit, handled, time, resolved
+    issues, total_count, has_next = fetch_issue_page(
+        cursor, project_uuid, page, limit, handled, time, resolved, after
     )
 
-    combined_logs = sorted(
-        errors + rejections, key=lambda x: x["created_at"], reverse=True
-    )
-    total_pages = calculate_total_error_pages(
-        cursor, project_uuid, limit, handled, time, resolved
-    )
+    # An empty page carries no count, e.g. when paging past the end.
+    if total_count is None:
+        total_pages = calculate_total_error_pages(
+            cursor, project_uuid, limit, handled, time, resolved
+        )
+    else:
+        total_pages = count_pages(total_count, limit)
+
+    # The cursor timestamp is rendered in UTC with a "Z" suffix, so it needs no
+    # URL-encoding, unlike a "+00:00" offset.
+    next_cursor = None
+    if has_next:
+        last_issue = issues[-1]
+        created_at = last_issue["created_at"].astimezone(timezone.utc)
+        next_cursor = {
+            "created_at": created_at.strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
+            "uuid": last_issue["uuid"],
+        }
 
     return {
-        "issues": combined_logs[:limit],
+        "issues": issues,
         "total_pages": total_pages,
         "current_page": int(page),
+        "next_cursor": next_cursor,
+        "has_next": has_next,
     }
 
 
@@ -79,104 +96,71 @@ def delete_issues_by_project(project_uuid: str, **kwargs: dict) -> bool:
 
 @db_read_connection
 def fetch_error(
-    project_uuid: str, error_uuid: str, **kwargs: dict
+    project_uuid: str, error_uuid: str, user_uuid: str, is_root: bool, **kwargs: dict
 ) -> Optional[Dict[str, str]]:
-    """Retrieves a specific error log by its UUID."""
+    """Retrieves a specific error log by its UUID, if it belongs to the project and
+    the user can access that project."""
     cursor = kwargs["cursor"]
 
-    query = """
+    query = f"""
     SELECT
-        name, message, created_at, filename, line_number, col_number, stack_trace,
-        handled, resolved, contexts, method, path, ip, os, browser, runtime, error_hash
-    FROM error_logs
-    WHERE uuid = %s
+        e.uuid, e.name, e.message, e.created_at, e.filename AS file, e.line_number,
+        e.col_number, e.stack_trace, e.handled, e.resolved, e.contexts, e.method,
+        e.path, e.os, e.browser, e.runtime, stats.total_occurrences,
+        stats.distinct_users
+    FROM error_logs e
+    JOIN projects p ON e.project_id = p.id
+    CROSS JOIN LATERAL (
+        SELECT
+            COUNT(*) AS total_occurrences,
+            COUNT(DISTINCT s.ip) AS distinct_users
+        FROM error_logs s
+        WHERE s.project_id = e.project_id AND s.error_hash = e.error_hash
+    ) stats
+    WHERE e.uuid = %s AND p.uuid = %s
+    AND {PROJECT_ACCESS_PREDICATE}
     """
 
-    cursor.execute(query, [error_uuid])
+    cursor.execute(query, [error_uuid, project_uuid, is_root, user_uuid])
     error = cursor.fetchone()
 
     if not error:
         return None
 
-    error_hash = error[16]
+    error["project_uuid"] = project_uuid
 
-    occurrence_query = """
-    SELECT COUNT(*)
-    FROM error_logs
-    WHERE error_hash = %s AND project_id = (
-        SELECT id FROM projects WHERE uuid = %s
-    )
-    """
-
-    cursor.execute(occurrence_query, [error_hash, project_uuid])
-    total_occurrences = cursor.fetchone()[0]
-
-    user_count_query = """
-    SELECT COUNT(DISTINCT ip)
-    FROM error_logs
-    WHERE error_hash = %s AND project_id = (
-        SELECT id FROM projects WHERE uuid = %s
-    )
-    """
-
-    cursor.execute(user_count_query, [error_hash, project_uuid])
-    distinct_users = cursor.fetchone()[0]
-
-    return {
-        "uuid": error_uuid,
-        "name": error[0],
-        "message": error[1],
-        "created_at": error[2],
-        "file": error[3],
-        "line_number": error[4],
-        "col_number": error[5],
-        "project_uuid": project_uuid,
-        "stack_trace": error[6],
-        "handled": error[7],
-        "resolved": error[8],
-        "contexts": error[9],
-        "method": error[10],
-        "path": error[11],
-        "os": error[13],
-        "browser": error[14],
-        "runtime": error[15],
-        "total_occurrences": total_occurrences,
-        "distinct_users": distinct_users,
-    }
+    return error
 
 
 @db_read_connection
 def fetch_rejection(
-    project_uuid: str, rejection_uuid: int, **kwargs: dict
+    project_uuid: str,
+    rejection_uuid: int,
+    user_uuid: str,
+    is_root: bool,
+    **kwargs: dict
 ) -> Optional[Dict[str, str]]:
-    """Retrieves a specific rejection log by its UUID."""
+    """Retrieves a specific rejection log by its UUID, if it belongs to the project
+    and the user can access that project."""
     cursor = kwargs["cursor"]
 
-    query = """
-    SELECT value, created_at, handled, resolved, method, path, os, browser, runtime
-    FROM rejection_logs
-    WHERE uuid = %s
+    query = f"""
+    SELECT
+        r.uuid, r.value, r.created_at, r.handled, r.resolved, r.method, r.path, r.os,
+        r.browser, r.runtime
+    FROM rejection_logs r
+    JOIN projects p ON r.project_id = p.id
+    WHERE r.uuid = %s AND p.uuid = %s
+    AND {PROJECT_ACCESS_PREDICATE}
     """
 
-    cursor.execute(query, [rejection_uuid])
+    cursor.execute(query, [rejection_uuid, project_uuid, is_root, user_uuid])
     rejection = cursor.fetchone()
 
     if rejection:
-        return {
-            "uuid": rejection_uuid,
-            "value": rejection[0],
-            "created_at": rejection[1],
-            "project_uuid": project_uuid,
-            "handled": rejection[2],
-            "resolved": rejection[3],
-            "method": rejection[4],
-            "path": rejection[5],
-            "os": rejection[6],
-            "browser": rejection[7],
-            "runtime": rejection[8],
-        }
+        rejection["project_uuid"] = project_uuid
 
-    return None
+    return rejection
 
 
 @db_write_connection
@@ -282,15 +266,10 @@ def get_issue_summary(project_uuid: str, **kwargs: dict) -> bool:
 
     issue_counts = issue_counts = [0] * 7
 
-    for day, count in error_results:
-        day_index = (today.date() - day).days
-        if 0 <= day_index < 7:
-            issue_counts[day_index] += count
-
-    for day, count in rejection_results:
-        day_index = (today.date() - day).days
+    for row in error_results + rejection_results:
+        day_index = (today.date() - row["day"]).days
         if 0 <= day_index < 7:
-            issue_counts[day_index] += count
+            issue_counts[day_index] += row["count"]
 
     return issue_counts[::-1]
 
@@ -306,12 +285,13 @@ def fetch_most_recent_log(
 
     cursor.execute(project_query, [project_uuid])
     project = cursor.fetchone()
-    project_id = project[0]
+    project_id = project["id"]
 
     # Query to get the most recent error log
     error_query = """
-    SELECT uuid, 'error' AS log_type, name, message, created_at, filename, line_number,
-           col_number, stack_trace, handled, resolved, contexts, method, path
+    SELECT
+        uuid, name, message, created_at, filename AS file, line_number, col_number,
+        stack_trace, handled, resolved, contexts, method, path
     FROM error_logs
     WHERE project_id = %s
     ORDER BY created_at DESC
@@ -323,9 +303,7 @@ def fetch_most_recent_log(
 
     # Query to get the most recent rejection log
     rejection_query = """
-    SELECT
-        uuid, 'rejection' AS log_type, value, created_at, handled, resolved, method,
-        path
+    SELECT uuid, value, created_at, handled, resolved, method, path
     FROM rejection_logs
     WHERE project_id = %s
     ORDER BY created_at DESC
@@ -339,7 +317,7 @@ def fetch_most_recent_log(
     most_recent = None
 
     if error and rejection:
-        if error[4] > rejection[3]:
+        if error["created_at"] > rejection["created_at"]:
             most_recent = error
         else:
             most_recent = rejection
@@ -349,33 +327,7 @@ def fetch_most_recent_log(
         most_recent = rejection
 
     if most_recent:
-        if most_recent[1] == "error":
-            return {
-                "uuid": most_recent[0],
-                "name": most_recent[2],
-                "message": most_recent[3],
-                "created_at": most_recent[4].isoformat(),
-                "file": most_recent[5],
-                "line_number": most_recent[6],
-                "col_number": most_recent[7],
-                "project_uuid": project_uuid,
-                "stack_trace": most_recent[8],
-                "handled": most_recent[9],
-                "resolved": most_recent[10],
-                "contexts": most_recent[11],
-                "method": most_recent[12],
-                "path": most_recent[13],
-            }
-        elif most_recent[1] == "rejection":
-            return {
-                "uuid": most_recent[0],
-                "value": most_recent[2],
-                "created_at": most_recent[3].isoformat(),
-                "project_uuid": project_uuid,
-                "handled": most_recent[4],
-                "resolved": most_recent[5],
-                "method": most_recent[6],
-                "path": most_recent[7],
-            }
-
-    return None
+        most_recent["created_at"] = most_recent["created_at"].isoformat()
+        most_recent["project_uuid"] = project_uuid
+
+    return most_recent
@@ -7,7 +7,7 @@ ensure the correct database connection context for reading or writing.
 """
 
 from typing import List
-from db import db_read_connection, db_write_connection
+from db import db_read_connection, db_write_connection, execute_prepared
 
 
 @db_read_connection
@@ -22,13 +22,13 @@ def fetch_project_users(project_uuid: str, **kwargs: dict) -> List[int]:
     ON u.id = pu.user_id
     JOIN projects p
     ON pu.project_id = p.id
-    WHERE p.uuid = %s
+    WHERE p.uuid = $1
     """
 
-    cursor.execute(query, (project_uuid,))
+    execute_prepared(cursor, "fetch_project_users", query, (project_uuid,))
     rows = cursor.fetchall()
 
-    users = [row[0] for row in rows]
+    users = [row["uuid"] for row in rows]
 
     return users
 
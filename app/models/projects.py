@@ -26,16 +26,12 @@ def fetch_projects(
         p.name,
         p.api_key,
         p.platform,
-        COUNT(DISTINCT e.id) AS error_count,
-        COUNT(DISTINCT r.id) AS rejection_count
+        (
+            (SELECT COUNT(*) FROM error_logs e WHERE e.project_id = p.id)
+            + (SELECT COUNT(*) FROM rejection_logs r WHERE r.project_id = p.id)
+        ) AS issue_count
     FROM
         projects p
-    LEFT JOIN
-        error_logs e ON e.project_id = p.id
-    LEFT JOIN
-        rejection_logs r ON r.project_id = p.id
-    GROUP BY
-        p.uuid, p.name, p.api_key, p.platform
     ORDER BY p.name
     LIMIT %s OFFSET %s
     """
@@ -47,21 +43,10 @@ def fetch_projects(
     if not rows:
         current_app.logger.info("No projects found for the given page and limit.")
 
-    projects = [
-        {
-            "uuid": row[0],
-            "name": row[1],
-            "api_key": row[2],
-            "platform": row[3],
-            "issue_count": row[4] + row[5],
-        }
-        for row in rows
-    ]
-
     total_pages = calculate_total_project_pages(cursor, limit)
 
     return {
-        "projects": projects,
+        "projects": rows,
         "total_pages": total_pages,
         "current_page": int(page),
     }
@@ -131,7 +116,7 @@ def get_project_name(uuid: str, **kwargs) -> Optional[str]:
     result = cursor.fetchone()
 
     if result:
-        return result[0]
+        return result["name"]
     else:
         return None
 
@@ -147,7 +132,7 @@ def get_topic_arn(project_uuid: str, **kwargs) -> Optional[str]:
     result = cursor.fetchone()
 
     if result:
-        return result[0]
+        return result["sns_topic_arn"]
     else:
         return None
 
@@ -166,4 +151,4 @@ def get_all_sns_subscription_arns_for_project(project_uuid: str, **kwargs) -> li
     cursor.execute(query, [project_uuid])
     rows = cursor.fetchall()
 
-    return [row[0] for row in rows]
+    return [row["sns_subscription_arn"] for row in rows]
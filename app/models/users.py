@@ -8,7 +8,7 @@ appropriate database connection context for reading or writing.
 
 from flask import current_app
 from typing import List, Dict, Optional, Union
-from db import db_read_connection, db_write_connection
+from db import db_read_connection, db_write_connection, execute_prepared
 from app.utils import calculate_total_user_project_pages
 
 
@@ -20,20 +20,8 @@ def fetch_all_users(**kwargs) -> Optional[List[Dict[str, str]]]:
     query = "SELECT uuid, first_name, last_name, email, is_root FROM users;"
 
     cursor.execute(query)
-    rows = cursor.fetchall()
-
-    users = [
-        {
-            "uuid": user[0],
-            "first_name": user[1],
-            "last_name": user[2],
-            "email": user[3],
-            "is_root": user[4],
-        }
-        for user in rows
-    ]
 
-    return users
+    return cursor.fetchall()
 
 
 @db_write_connection
@@ -105,21 +93,12 @@ def fetch_user_by_email(
     SELECT
         u.uuid, u.first_name, u.last_name, u.password_hash, u.is_root
     FROM users u
-    WHERE u.email = %s;
+    WHERE u.email = $1
     """
 
-    cursor.execute(query, (email,))
-    user = cursor.fetchone()
-    if user:
-        return {
-            "uuid": user[0],
-            "first_name": user[1],
-            "last_name": user[2],
-            "password_hash": user[3],
-            "is_root": user[4],
-        }
+    execute_prepared(cursor, "fetch_user_by_email", query, (email,))
 
-    return None
+    return cursor.fetchone()
 
 
 @db_read_connection
@@ -130,25 +109,34 @@ def user_is_root(user_uuid, **kwargs):
     query = """
     SELECT is_root
     FROM users
-    WHERE uuid = %s
+    WHERE uuid = $1
     """
 
-    cursor.execute(query, (user_uuid,))
+    execute_prepared(cursor, "user_is_root", query, (user_uuid,))
 
     result = cursor.fetchone()
 
     if result is None:
         return False
 
-    is_root = result[0]
-    return is_root
+    return result["is_root"]
 
 
 @db_read_connection
-def fetch_projects_for_user(user_uuid, page: int, limit: int, **kwargs) -> dict:
-    """Fetches all projects assigned to a specific user by user ID."""
+def fetch_projects_for_user(
+    user_uuid: str,
+    limit: int,
+    after_name: Optional[str] = None,
+    after_uuid: Optional[str] = None,
+    **kwargs,
+) -> dict:
+    """Fetches a page of projects assigned to a specific user by user ID.
+
+    Pages are keyed on (name, uuid): pass the values of the last project from the
+    previous page as `after_name` and `after_uuid` to fetch the next one. One extra
+    row is fetched to tell whether another page follows.
+    """
     cursor = kwargs["cursor"]
-    offset = (page - 1) * limit if limit else 0
 
     query = """
     SELECT
@@ -156,46 +144,49 @@ def fetch_projects_for_user(user_uuid, page: int, limit: int, **kwargs) -> dict:
         p.name,
         p.api_key,
         p.platform,
-        COUNT(DISTINCT e.id) AS error_count,
-        COUNT(DISTINCT r.id) AS rejection_count
+        (
+            (SELECT COUNT(*) FROM error_logs e WHERE e.project_id = p.id)
+            + (SELECT COUNT(*) FROM rejection_logs r WHERE r.project_id = p.id)
+        ) AS issue_count
     FROM
         projects p
     JOIN
         projects_users pu ON p.id = pu.project_id
     JOIN
         users u ON pu.user_id = u.id
-    LEFT JOIN
-        error_logs e ON e.project_id = p.id
-    LEFT JOIN
-        rejection_logs r ON r.project_id = p.id
     WHERE
         u.uuid = %s
-    GROUP BY
-        p.uuid, p.name, p.api_key, p.platform
-    ORDER BY p.name
-    LIMIT %s OFFSET %s;
     """
 
-    cursor.execute(query, (user_uuid, limit, offset))
+    params = [user_uuid]
+
+    if after_name is not None and after_uuid is not None:
+        query += " AND (p.name, p.uuid) > (%s, %s)"
+        params.extend([after_name, after_uuid])
+
+    query += """
+    ORDER BY p.name, p.uuid
+    LIMIT %s;
+    """
+    params.append(limit + 1)
+
+    cursor.execute(query, params)
     rows = cursor.fetchall()
+    has_next = len(rows) > limit
+    projects = rows[:limit]
 
-    projects = [
-        {
-            "uuid": project[0],
-            "name": project[1],
-            "api_key": project[2],
-            "platform": project[3],
-            "issue_count": project[4] + project[5],
-        }
-        for project in rows
-    ]
+    next_cursor = None
+    if has_next:
+        last_project = projects[-1]
+        next_cursor = {"name": last_project["name"], "uuid": last_project["uuid"]}
 
     total_pages = calculate_total_user_project_pages(cursor, user_uuid, limit)
 
     return {
         "projects": projects,
+        "next_cursor": next_cursor,
+        "has_next": has_next,
         "total_pages": total_pages,
-        "current_page": int(page),
     }
 
 
@@ -204,20 +195,15 @@ def fetch_user(user_uuid: str, **kwargs) -> dict:
     """Fetches a user's uuid, first and last name, email, and root status."""
     cursor = kwargs["cursor"]
 
-    query = "SELECT first_name, last_name, email, is_root FROM users WHERE uuid = %s;"
+    query = """
+    SELECT uuid, first_name, last_name, email, is_root
+    FROM users
+    WHERE uuid = $1
+    """
 
-    cursor.execute(query, [user_uuid])
-    user = cursor.fetchone()
-    if not user:
-        return None
+    execute_prepared(cursor, "fetch_user", query, (user_uuid,))
 
-    return {
-        "uuid": user_uuid,
-        "first_name": user[0],
-        "last_name": user[1],
-        "email": user[2],
-        "is_root": user[3],
-    }
+    return cursor.fetchone()
 
 
 @db_read_connection
@@ -236,4 +222,4 @@ def get_all_sns_subscription_arns_for_user(user_uuid: str, **kwargs) -> list:
     rows = cursor.fetchall()
     current_app.logger.info(rows)
 
-    return [row[0] for row in rows]
+    return [row["sns_subscription_arn"] for row in rows]
@@ -5,13 +5,10 @@ credentials, generates access and refresh tokens, and manages token-based authen
 using JWT. Passwords are securely verified using bcrypt.
 """
 
-import bcrypt
 from flask import jsonify, request, make_response, Response, Blueprint, current_app
 from app.models import fetch_user_by_email
-from app.utils.auth import TokenManager, AuthManager
-
-token_manager = TokenManager()
-auth_manager = AuthManager(token_manager)
+from app.utils import check_password
+from app.extensions import token_manager
 
 bp = Blueprint("auth", __name__)
 
@@ -32,7 +29,7 @@ def login() -> Response:
 
     if not email or not password:
         current_app.logger.error(
-            f"Login request missing email or password: email={email}"
+            "Login request missing email or password: email=%s", email
         )
         return jsonify({"message": "Invalid email or password"}), 400
 
@@ -41,7 +38,7 @@ def login() -> Response:
 
         if not user:
             current_app.logger.warning(
-                f"Login failed: user with email {email} not found."
+                "Login failed: user with email %s not found.", email
             )
             return jsonify({"message": "Invalid email or password"}), 400
 
@@ -53,9 +50,9 @@ def login() -> Response:
         is_root = user.get("is_root")
 
         # Verify password
-        if not bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8")):
+        if not check_password(password, password_hash):
             current_app.logger.warning(
-                f"Login failed: invalid password for email {email}."
+                "Login failed: invalid password for email %s.", email
             )
             return jsonify({"message": "Invalid email or password"}), 401
 
@@ -85,7 +82,9 @@ def login() -> Response:
         )
         return response
     except Exception as e:
-        current_app.logger.error(f"Login failed for user {email}: {e}", exc_info=True)
+        current_app.logger.error(
+            "Login failed for user %s: %s", email, e, exc_info=True
+        )
         return jsonify({"message": "Login failed."}), 500
 
 
@@ -118,14 +117,14 @@ def refresh() -> Response:
         new_access_token, error_response = token_manager.refresh_access_token()
         if error_response:
             current_app.logger.warning(
-                f"Token refresh failed: {error_response["message"]}."
+                "Token refresh failed: %s.", error_response["message"]
             )
             return jsonify(error_response), 401
 
         current_app.logger.info("Access token refreshed successfully.")
         return jsonify({"payload": new_access_token}), 200
     except Exception as e:
-        current_app.logger.error(f"Failed to refresh access token: {e}", exc_info=True)
+        current_app.logger.error("Failed to refresh access token: %s", e, exc_info=True)
         return (
             jsonify({"message": "Unable to refresh session. Please log in again."}),
             500,
@@ -2,13 +2,15 @@ import jwt
 from flask import jsonify, Blueprint, Response, request, current_app
 from flask_socketio import join_room
 from app.socketio import socketio
-from app.utils import send_sns_notification
-from app.utils.auth import TokenManager, AuthManager
+from app.utils import (
+    send_sns_notification,
+    invalidate_cached_response,
+    invalidate_cached_counts,
+    is_valid_uuid,
+)
+from app.extensions import token_manager
 from app.models import fetch_project_users, get_project_name, fetch_most_recent_log
 
-token_manager = TokenManager()
-auth_manager = AuthManager(token_manager)
-
 bp = Blueprint("notifications", __name__)
 
 
@@ -31,20 +33,28 @@ def receive_webhook() -> Response:
             400,
         )
 
+    if not is_valid_uuid(project_uuid):
+        current_app.logger.error("Malformed project UUID in webhook: %s", project_uuid)
+        return jsonify({"message": "Invalid project identifier."}), 400
+
     try:
+        invalidate_cached_response(("summary", project_uuid))
+        invalidate_cached_counts("issues", project_uuid)
         current_app.logger.info("Trying to send notifications...")
         send_sns_notification(project_uuid)
         current_app.logger.info(
-            f"SNS notification sent for project UUID={project_uuid}."
+            "SNS notification sent for project UUID=%s.", project_uuid
         )
         send_notification_to_frontend(project_uuid)
         current_app.logger.info(
-            f"Frontend notifications sent for project UUID={project_uuid}."
+            "Frontend notifications sent for project UUID=%s.", project_uuid
         )
         return jsonify({"message": "Webhook received."}), 200
     except Exception as e:
         current_app.logger.error(
-            f"Failed to handle webhook for project UUID={project_uuid}: {e}",
+            "Failed to handle webhook for project UUID=%s: %s",
+            project_uuid,
+            e,
             exc_info=True,
         )
         return jsonify({"message": "Failed to process webhook."}), 500
@@ -65,7 +75,9 @@ def handle_connect(auth):
 
         if user_uuid:
             join_room(user_uuid)
-            current_app.logger.info(f"User UUID={user_uuid} joined notifications room.")
+            current_app.logger.info(
+                "User UUID=%s joined notifications room.", user_uuid
+            )
             socketio.emit(
                 "authenticated",
                 {"message": "Connection authenticated"},
@@ -83,7 +95,7 @@ def handle_connect(auth):
         return False
     except Exception as e:
         current_app.logger.error(
-            f"Failed to handle SocketIO connection: {e}", exc_info=True
+            "Failed to handle SocketIO connection: %s", e, exc_info=True
         )
         return False
 
@@ -98,7 +110,7 @@ def handle_disconnect():
 
 def send_notification_to_frontend(project_uuid):
     current_app.logger.debug(
-        f"Preparing frontend notifications for project UUID={project_uuid}."
+        "Preparing frontend notifications for project UUID=%s.", project_uuid
     )
 
     try:
@@ -113,7 +125,7 @@ def send_notification_to_frontend(project_uuid):
         }
 
         for user_uuid in project_users:
-            current_app.logger.debug(f"Sending notification to user UUID={user_uuid}.")
+            current_app.logger.debug("Sending notification to user UUID=%s.", user_uuid)
             socketio.emit(
                 "new_notification",
                 data,
@@ -122,14 +134,15 @@ def send_notification_to_frontend(project_uuid):
             )
 
         current_app.logger.info(
-            (
-                f"Notifications sent to {len(project_users)} users for project "
-                f"UUID={project_uuid}."
-            )
+            "Notifications sent to %s users for project UUID=%s.",
+            len(project_users),
+            project_uuid,
         )
     except Exception as e:
         current_app.logger.error(
-            f"Failed to send notifications for project UUID={project_uuid}: {e}",
+            "Failed to send notifications for project UUID=%s: %s",
+            project_uuid,
+            e,
             exc_info=True,
         )
         raise
@@ -6,8 +6,9 @@ authorization enforced via JWT. Each route performs specific operations on error
 rejections, such as resolving or deleting individual items.
 """
 
-from flask import jsonify, request, Response, current_app
+from flask import jsonify, request, Response, current_app, g
 from flask import Blueprint
+from pydantic import ValidationError
 from app.models import (
     fetch_issues_by_project,
     delete_issues_by_project,
@@ -19,70 +20,74 @@ from app.models import (
     delete_rejection_by_id,
     get_issue_summary,
 )
-from app.utils.auth import TokenManager, AuthManager
-
-token_manager = TokenManager()
-auth_manager = AuthManager(token_manager)
+from app.utils import (
+    cached_json_response,
+    invalidate_cached_response,
+    invalidate_cached_counts,
+    log_exception_sampled,
+    IssueQuery,
+)
+from app.extensions import auth_manager
 
 bp = Blueprint("project_issues", __name__)
 
 
 @bp.route("", methods=["GET"])
-@auth_manager.authenticate
-@auth_manager.authorize_project_access
+@auth_manager.require(project=True)
 def get_issues(project_uuid: str) -> Response:
     """Fetches a paginated list of issues for a specified project."""
-    page = request.args.get("page", 1, type=int)
-    limit = request.args.get("limit", 10, type=int)
-    handled = request.args.get("handled", None)
-    time = request.args.get("time", None)
-    resolved = request.args.get("resolved", None)
-
-    current_app.logger.debug(
-        (
-            f"Fetching issues for project UUID={project_uuid} with page={page}, "
-            f"limit={limit}"
-        )
-    )
-
-    if page < 1 or limit < 1:
-        current_app.logger.error(
-            f"Invalid pagination parameters: page={page}, limit={limit}"
-        )
+    try:
+        query = IssueQuery.model_validate(request.args.to_dict())
+    except ValidationError as e:
+        current_app.logger.error("Invalid issue query parameters: %s", e)
         return (
-            jsonify({"message": "Invalid pagination parameters."}),
+            jsonify({"message": "Invalid query parameters."}),
             400,
         )
 
+    current_app.logger.debug(
+        "Fetching issues for project UUID=%s with page=%s, limit=%s, after=%s",
+        project_uuid,
+        query.page,
+        query.limit,
+        query.after,
+    )
+
     if not project_uuid:
         current_app.logger.error("Project identifier is required but missing.")
         return jsonify({"message": "Project identifier is required."}), 400
 
     try:
         issue_data = fetch_issues_by_project(
-            project_uuid, page, limit, handled, time, resolved
+            project_uuid,
+            query.page,
+            query.limit,
+            query.handled,
+            query.time,
+            query.resolved,
+            query.after,
         )
         current_app.logger.info(
-            (
-                f"Fetched {len(issue_data['issues'])} issues for project "
-                f"UUID={project_uuid}."
-            )
+            "Fetched %s issues for project UUID=%s.",
+            len(issue_data["issues"]),
+            project_uuid,
         )
         return jsonify({"payload": issue_data}), 200
     except Exception as e:
-        current_app.logger.error(
-            f"Failed to fetch issues for project UUID={project_uuid}: {e}",
-            exc_info=True,
+        log_exception_sampled(
+            current_app.logger,
+            "Failed to fetch issues for project UUID=%s: %s",
+            project_uuid,
+            e,
         )
         return jsonify({"message": "Failed to fetch issues."}), 500
 
 
 @bp.route("", methods=["DELETE"])
-@auth_manager.authenticate
-@auth_manager.authorize_project_access
+@auth_manager.require(project=True)
 def delete_issues(project_uuid: str) -> Response:
     """Deletes all issues for a specified project."""
-    current_app.logger.debug(f"Deleting all issues for project UUID={project_uuid}.")
+    current_app.logger.debug("Deleting all issues for project UUID=%s.", project_uuid)
 
     if not project_uuid:
         current_app.logger.error("Project identifier is required but missing.")
@@ -91,33 +96,37 @@ def delete_issues(project_uuid: str) -> Response:
     try:
         success = delete_issues_by_project(project_uuid)
         if success:
+            invalidate_cached_response(("summary", project_uuid))
+            invalidate_cached_counts("issues", project_uuid)
             current_app.logger.info(
-                f"Deleted all issues for project UUID={project_uuid}."
+                "Deleted all issues for project UUID=%s.", project_uuid
             )
             return "", 204
         else:
             current_app.logger.warning(
-                f"No issues found for project UUID={project_uuid}."
+                "No issues found for project UUID=%s.", project_uuid
             )
             return (
                 jsonify({"message": "No issues found for this project."}),
                 404,
             )
     except Exception as e:
-        current_app.logger.error(
-            f"Failed to delete issues for project UUID={project_uuid}: {e}",
-            exc_info=True,
+        log_exception_sampled(
+            current_app.logger,
+            "Failed to delete issues for project UUID=%s: %s",
+            project_uuid,
+            e,
         )
         return jsonify({"message": "Failed to delete issues."}), 500
 
 
 @bp.route("/errors/<error_uuid>", methods=["GET"])
-@auth_manager.authenticate
-@auth_manager.authorize_project_access
+# Project access is applied by the query via PROJECT_ACCESS_PREDICATE.
+@auth_manager.require()
 def get_error(project_uuid: str, error_uuid: str) -> Response:
     """Retrieves a specific error by its ID."""
     current_app.logger.debug(
-        f"Fetching error UUID={error_uuid} for project UUID={project_uuid}."
+        "Fetching error UUID=%s for project UUID=%s.", error_uuid, project_uuid
     )
 
     if not project_uuid:
@@ -129,35 +138,45 @@ def get_error(project_uuid: str, error_uuid: str) -> Response:
         return jsonify({"message": "Error identifier required."}), 400
 
     try:
-        error = fetch_error(project_uuid, error_uuid)
+        user_payload = g.user_payload
+        error = fetch_error(
+            project_uuid,
+            error_uuid,
+            user_payload.get("user_uuid"),
+            user_payload.get("is_root"),
+        )
         if error:
             current_app.logger.info(
-                f"Error UUID={error_uuid} fetched for project UUID={project_uuid}."
+                "Error UUID=%s fetched for project UUID=%s.", error_uuid, project_uuid
             )
             return jsonify({"payload": error}), 200
         else:
+            error_response = auth_manager.authorize_project_access(project_uuid)
+            if error_response:
+                return error_response
+
             current_app.logger.warning(
-                f"Error UUID={error_uuid} not found for project UUID={project_uuid}."
+                "Error UUID=%s not found for project UUID=%s.", error_uuid, project_uuid
             )
             return jsonify({"message": "Error not found."}), 404
     except Exception as e:
-        current_app.logger.error(
-            (
-                f"Failed to fetch error UUID={error_uuid} for project "
-                f"UUID={project_uuid}: {e}"
-            ),
-            exc_info=True,
+        log_exception_sampled(
+            current_app.logger,
+            "Failed to fetch error UUID=%s for project UUID=%s: %s",
+            error_uuid,
+            project_uuid,
+            e,
         )
         return jsonify({"message": "Failed to fetch error."}), 500
 
 
 @bp.route("/rejections/<rejection_uuid>", methods=["GET"])
-@auth_manager.authenticate
-@auth_manager.authorize_project_access
+# Project access is applied by the query via PROJECT_ACCESS_PREDICATE.
+@auth_manager.require()
 def get_rejection(project_uuid: str, rejection_uuid: str) -> Response:
     """Retrieves a specific rejection by its UUID."""
     current_app.logger.debug(
-        f"Fetching rejection UUID={rejection_uuid} for project UUID={project_uuid}."
+        "Fetching rejection UUID=%s for project UUID=%s.", rejection_uuid, project_uuid
     )
 
     if not project_uuid:
@@ -169,44 +188,50 @@ def get_rejection(project_uuid: str, rejection_uuid: str) -> Response:
         return jsonify({"message": "Rejection identifier required."}), 400
 
     try:
-        rejection = fetch_rejection(project_uuid, rejection_uuid)
+        user_payload = g.user_payload
+        rejection = fetch_rejection(
+            project_uuid,
+            rejection_uuid,
+            user_payload.get("user_uuid"),
+            user_payload.get("is_root"),
+        )
         if rejection:
             current_app.logger.info(
-                (
-                    f"Rejection UUID={rejection_uuid} fetched for project "
-                    f"UUID={project_uuid}."
-                )
+                "Rejection UUID=%s fetched for project UUID=%s.",
+                rejection_uuid,
+                project_uuid,
             )
             return jsonify({"payload": rejection}), 200
         else:
+            error_response = auth_manager.authorize_project_access(project_uuid)
+            if error_response:
+                return error_response
+
             current_app.logger.warning(
-                (
-                    f"Rejection UUID={rejection_uuid} not found for project "
-                    f"UUID={project_uuid}."
-                )
+                "Rejection UUID=%s not found for project UUID=%s.",
+                rejection_uuid,
+                project_uuid,
             )
             return jsonify({"message": "Rejection not found."}), 404
     except Exception as e:
-        current_app.logger.error(
-            (
-                f"Failed to fetch rejection UUID={rejection_uuid} for project "
-                f"UUID={project_uuid}: {e}"
-            ),
-            exc_info=True,
+        log_exception_sampled(
+            current_app.logger,
+            "Failed to fetch rejection UUID=%s for project UUID=%s: %s",
+            rejection_uuid,
+            project_uuid,
+            e,
         )
         return jsonify({"message": "Failed to fetch rejection."}), 500
 
 
 @bp.route("/errors/<error_uuid>", methods=["PATCH"])
-@auth_manager.authenticate
-@auth_manager.authorize_project_access
+@auth_manager.require(project=True)
 def toggle_error(project_uuid: str, error_uuid: str) -> Response:
     """Toggles the resolved state of a specific error."""
     current_app.logger.debug(
-        (
-            f"Toggling resolved status of error UUID={error_uuid} for project "
-            f"UUID={project_uuid}."
-        )
+        "Toggling resolved status of error UUID=%s for project UUID=%s.",
+        error_uuid,
+        project_uuid,
     )
 
     if not project_uuid:
@@ -232,39 +257,37 @@ def toggle_error(project_uuid: str, error_uuid: str) -> Response:
     try:
         success = update_error_resolved(error_uuid, new_resolved_state)
         if success:
+            invalidate_cached_counts("issues", project_uuid)
             current_app.logger.info(
-                (
-                    f"Error UUID={error_uuid} resolved state updated in project "
-                    f"UUID={project_uuid}."
-                )
+                "Error UUID=%s resolved state updated in project UUID=%s.",
+                error_uuid,
+                project_uuid,
             )
             return "", 204
         else:
             current_app.logger.warning(
-                f"Error UUID={error_uuid} not found in project UUID={project_uuid}."
+                "Error UUID=%s not found in project UUID=%s.", error_uuid, project_uuid
             )
             return jsonify({"message": "Error not found."}), 404
     except Exception as e:
-        current_app.logger.error(
-            (
-                f"Failed to toggle error UUID={error_uuid} for project "
-                f"UUID={project_uuid}: {e}"
-            ),
-            exc_info=True,
+        log_exception_sampled(
+            current_app.logger,
+            "Failed to toggle error UUID=%s for project UUID=%s: %s",
+            error_uuid,
+            project_uuid,
+            e,
         )
         return jsonify({"message": "Failed to toggle error resolved state."}), 500
 
 
 @bp.route("/rejections/<rejection_uuid>", methods=["PATCH"])
-@auth_manager.authenticate
-@auth_manager.authorize_project_access
+@auth_manager.require(project=True)
 def toggle_rejection(project_uuid: str, rejection_uuid: str) -> Response:
     """Toggles the resolved state of a specific rejection."""
     current_app.logger.debug(
-        (
-            f"Toggling resolved state of rejection UUID={rejection_uuid} for project "
-            f"UUID={project_uuid}."
-        )
+        "Toggling resolved state of rejection UUID=%s for project UUID=%s.",
+        rejection_uuid,
+        project_uuid,
     )
 
     if not project_uuid:
@@ -289,39 +312,37 @@ def toggle_rejection(project_uuid: str, rejection_uuid: str) -> Response:
     try:
         success = update_rejection_resolved(rejection_uuid, new_resolved_state)
         if success:
+            invalidate_cached_counts("issues", project_uuid)
             current_app.logger.info(
-                (
-                    f"Rejection UUID={rejection_uuid} resolved state updated in "
-                    f"project UUID={project_uuid}."
-                )
+                "Rejection UUID=%s resolved state updated in project UUID=%s.",
+                rejection_uuid,
+                project_uuid,
             )
             return "", 204
         else:
             current_app.logger.warning(
-                (
-                    f"Rejection UUID={rejection_uuid} not found in project "
-                    f"UUID={project_uuid}."
-                )
+                "Rejection UUID=%s not found in project UUID=%s.",
+                rejection_uuid,
+                project_uuid,
             )
             return jsonify({"message": "Rejection not found."}), 404
     except Exception as e:
-        current_app.logger.error(
-            (
-                f"Failed to toggle rejection UUID={rejection_uuid} for project "
-                f"UUID={project_uuid}: {e}"
-            ),
-            exc_info=True,
+        log_exception_sampled(
+            current_app.logger,
+            "Failed to toggle rejection UUID=%s for project UUID=%s: %s",
+            rejection_uuid,
+            project_uuid,
+            e,
         )
         return jsonify({"message": "Failed to toggle rejection resolved state."}), 500
 
 
 @bp.route("/errors/<error_uuid>", methods=["DELETE"])
-@auth_manager.authenticate
-@auth_manager.authorize_project_access
+@auth_manager.require(project=True)
 def delete_error(project_uuid: str, error_uuid: str) -> Response:
     """Deletes a specific error by its UUID."""
     current_app.logger.debug(
-        f"Deleting error UUID={error_uuid} from project UUID={project_uuid}."
+        "Deleting error UUID=%s from project UUID=%s.", error_uuid, project_uuid
     )
 
     if not project_uuid:
@@ -335,33 +356,34 @@ def delete_error(project_uuid: str, error_uuid: str) -> Response:
     try:
         success = delete_error_by_id(error_uuid)
         if success:
+            invalidate_cached_response(("summary", project_uuid))
+            invalidate_cached_counts("issues", project_uuid)
             current_app.logger.info(
-                f"Error UUID={error_uuid} deleted from project UUID={project_uuid}."
+                "Error UUID=%s deleted from project UUID=%s.", error_uuid, project_uuid
             )
             return "", 204
         else:
             current_app.logger.warning(
-                f"Error UUID={error_uuid} not found in project UUID={project_uuid}."
+                "Error UUID=%s not found in project UUID=%s.", error_uuid, project_uuid
             )
             return jsonify({"message": "Error not found."}), 404
     except Exception as e:
-        current_app.logger.error(
-            (
-                f"Failed to delete error UUID={error_uuid} from project "
-                f"UUID={project_uuid}: {e}"
-            ),
-            exc_info=True,
+        log_exception_sampled(
+            current_app.logger,
+            "Failed to delete error UUID=%s from project UUID=%s: %s",
+            error_uuid,
+            project_uuid,
+            e,
         )
         return jsonify({"message": "Failed to delete error."}), 500
 
 
 @bp.route("/rejections/<rejection_uuid>", methods=["DELETE"])
-@auth_manager.authenticate
-@auth_manager.authorize_project_access
+@auth_manager.require(project=True)
 def delete_rejection(project_uuid: str, rejection_uuid: str) -> Response:
     """Deletes a specific rejection by its UUID."""
     current_app.logger.debug(
-        f"Deleting rejection UUID={rejection_uuid} from project UUID={project_uuid}."
+        "Deleting rejection UUID=%s from project UUID=%s.", rejection_uuid, project_uuid
     )
 
     if not project_uuid:
@@ -375,52 +397,57 @@ def delete_rejection(project_uuid: str, rejection_uuid: str) -> Response:
     try:
         success = delete_rejection_by_id(rejection_uuid)
         if success:
+            invalidate_cached_response(("summary", project_uuid))
+            invalidate_cached_counts("issues", project_uuid)
             current_app.logger.info(
-                (
-                    f"Rejection UUID={rejection_uuid} deleted from project "
-                    f"UUID={project_uuid}."
-                )
+                "Rejection UUID=%s deleted from project UUID=%s.",
+                rejection_uuid,
+                project_uuid,
             )
             return "", 204
         else:
             current_app.logger.warning(
-                (
-                    f"Rejection UUID={rejection_uuid} not found in project "
-                    f"UUID={project_uuid}."
-                )
+                "Rejection UUID=%s not found in project UUID=%s.",
+                rejection_uuid,
+                project_uuid,
             )
             return jsonify({"message": "Rejection not found."}), 404
     except Exception as e:
-        current_app.logger.error(
-            (
-                f"Failed to delete rejection UUID={rejection_uuid} from project "
-                f"UUID={project_uuid}: {e}"
-            ),
-            exc_info=True,
+        log_exception_sampled(
+            current_app.logger,
+            "Failed to delete rejection UUID=%s from project UUID=%s: %s",
+            rejection_uuid,
+            project_uuid,
+            e,
         )
         return jsonify({"message": "Failed to delete rejection."}), 500
 
 
 @bp.route("/summary", methods=["GET"])
-@auth_manager.authenticate
-@auth_manager.authorize_project_access
+@auth_manager.require(project=True)
 def get_summary(project_uuid: str) -> Response:
     """Gets issue count per day for the last 7 days for this project."""
-    current_app.logger.debug(f"Fetching issue summary for project UUID={project_uuid}.")
+    current_app.logger.debug(
+        "Fetching issue summary for project UUID=%s.", project_uuid
+    )
 
     if not project_uuid:
         current_app.logger.error("Project identifier is required but missing.")
         return jsonify({"message": "Project identifier required."}), 400
 
     try:
-        daily_counts = get_issue_summary(project_uuid)
+        response = cached_json_response(
+            ("summary", project_uuid), lambda: get_issue_summary(project_uuid)
+        )
         current_app.logger.info(
-            f"Fetched issue summary for project UUID={project_uuid}."
+            "Fetched issue summary for project UUID=%s.", project_uuid
         )
-        return jsonify({"payload": daily_counts}), 200
+        return response
     except Exception as e:
-        current_app.logger.error(
-            f"Failed to fetch issue summary for project UUID={project_uuid}: {e}",
-            exc_info=True,
+        log_exception_sampled(
+            current_app.logger,
+            "Failed to fetch issue summary for project UUID=%s: %s",
+            project_uuid,
+            e,
         )
         return jsonify({"message": "Failed to fetch issue summary."}), 500
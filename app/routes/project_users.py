@@ -13,21 +13,22 @@ from app.models import (
     remove_user_from_project,
     user_is_root,
 )
-from app.utils.auth import TokenManager, AuthManager
-from app.utils import create_sns_subscription, remove_sns_subscription
-
-token_manager = TokenManager()
-auth_manager = AuthManager(token_manager)
+from app.extensions import auth_manager
+from app.utils.auth import invalidate_project_users
+from app.utils import (
+    create_sns_subscription,
+    remove_sns_subscription,
+    is_valid_uuid,
+)
 
 bp = Blueprint("project_users", __name__)
 
 
 @bp.route("", methods=["GET"])
-@auth_manager.authenticate
-@auth_manager.authorize_root
+@auth_manager.require(root=True)
 def get_project_users(project_uuid: str) -> Response:
     """Fetches all user uuids associated with a specified project."""
-    current_app.logger.debug(f"Fetching users for project UUID={project_uuid}.")
+    current_app.logger.debug("Fetching users for project UUID=%s.", project_uuid)
 
     if not project_uuid:
         current_app.logger.error("Project identifier is required but missing.")
@@ -36,22 +37,24 @@ def get_project_users(project_uuid: str) -> Response:
     try:
         users = fetch_project_users(project_uuid)
         current_app.logger.info(
-            f"Fetched {len(users)} users for project UUID={project_uuid}."
+            "Fetched %s users for project UUID=%s.", len(users), project_uuid
         )
         return jsonify({"payload": users}), 200
     except Exception as e:
         current_app.logger.error(
-            f"Failed to fetch users for project UUID={project_uuid}: {e}", exc_info=True
+            "Failed to fetch users for project UUID=%s: %s",
+            project_uuid,
+            e,
+            exc_info=True,
         )
         return jsonify({"message": "Failed to fetch users."}), 500
 
 
 @bp.route("", methods=["POST"])
-@auth_manager.authenticate
-@auth_manager.authorize_root
+@auth_manager.require(root=True)
 def add_project_user(project_uuid: str) -> Response:
     """Adds a user to a specified project."""
-    current_app.logger.debug(f"Adding user to project UUID={project_uuid}.")
+    current_app.logger.debug("Adding user to project UUID=%s.", project_uuid)
 
     if not project_uuid:
         current_app.logger.error("Project identifier is required but missing.")
@@ -67,13 +70,16 @@ def add_project_user(project_uuid: str) -> Response:
         current_app.logger.error("User identifier is required but missing.")
         return jsonify({"message": "User identifier required."}), 400
 
+    if not is_valid_uuid(user_uuid):
+        current_app.logger.error("Malformed user UUID in request: %s", user_uuid)
+        return jsonify({"message": f"User with UUID={user_uuid} does not exist."}), 404
+
     try:
         if user_is_root(user_uuid):
             current_app.logger.warning(
-                (
-                    f"Attempt to add root user UUID={user_uuid} to project "
-                    f"UUID={project_uuid}."
-                )
+                "Attempt to add root user UUID=%s to project UUID=%s.",
+                user_uuid,
+                project_uuid,
             )
             return (
                 jsonify({"message": "Admin cannot be added to projects."}),
@@ -82,17 +88,17 @@ def add_project_user(project_uuid: str) -> Response:
 
         success = add_user_to_project(project_uuid, user_uuid)
         if success:
+            invalidate_project_users(project_uuid)
             create_sns_subscription(project_uuid, user_uuid)
             current_app.logger.info(
-                f"User UUID={user_uuid} added to project UUID={project_uuid}."
+                "User UUID=%s added to project UUID=%s.", user_uuid, project_uuid
             )
             return "", 204
         else:
             current_app.logger.warning(
-                (
-                    f"User UUID={user_uuid} is already associated with project "
-                    f"UUID={project_uuid}."
-                )
+                "User UUID=%s is already associated with project UUID=%s.",
+                user_uuid,
+                project_uuid,
             )
             return (
                 jsonify({"message": "User is already associated with the project."}),
@@ -103,19 +109,21 @@ def add_project_user(project_uuid: str) -> Response:
         return jsonify({"message": str(e)}), 404
     except Exception as e:
         current_app.logger.error(
-            f"Failed to add user UUID={user_uuid} to project UUID={project_uuid}: {e}",
+            "Failed to add user UUID=%s to project UUID=%s: %s",
+            user_uuid,
+            project_uuid,
+            e,
             exc_info=True,
         )
         return jsonify({"message": "Failed to add user to project."}), 500
 
 
 @bp.route("/<user_uuid>", methods=["DELETE"])
-@auth_manager.authenticate
-@auth_manager.authorize_root
+@auth_manager.require(root=True)
 def remove_project_user(project_uuid: str, user_uuid: str) -> Response:
     """Removes a user from a specified project."""
     current_app.logger.debug(
-        f"Removing user UUID={user_uuid} from project UUID={project_uuid}."
+        "Removing user UUID=%s from project UUID=%s.", user_uuid, project_uuid
     )
 
     if not project_uuid:
@@ -129,14 +137,15 @@ def remove_project_user(project_uuid: str, user_uuid: str) -> Response:
     try:
         success = remove_user_from_project(project_uuid, user_uuid)
         if success:
+            invalidate_project_users(project_uuid)
             remove_sns_subscription(project_uuid, user_uuid)
             current_app.logger.info(
-                f"User UUID={user_uuid} removed from project UUID={project_uuid}."
+                "User UUID=%s removed from project UUID=%s.", user_uuid, project_uuid
             )
             return "", 204
         else:
             current_app.logger.warning(
-                f"Project UUID={project_uuid} or user UUID={user_uuid} not found."
+                "Project UUID=%s or user UUID=%s not found.", project_uuid, user_uuid
             )
             return (
                 jsonify({"message": "Project or user not found."}),
@@ -144,10 +153,10 @@ def remove_project_user(project_uuid: str, user_uuid: str) -> Response:
             )
     except Exception as e:
         current_app.logger.error(
-            (
-                f"Failed to remove user UUID={user_uuid} from project "
-                f"UUID={project_uuid}: {e}"
-            ),
+            "Failed to remove user UUID=%s from project UUID=%s: %s",
+            user_uuid,
+            project_uuid,
+            e,
             exc_info=True,
         )
         return jsonify({"message": "Failed to remove user from project."}), 500
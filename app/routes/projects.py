@@ -12,34 +12,32 @@ from app.models import (
     delete_project_by_id,
     update_project_name,
 )
-from app.utils.auth import TokenManager, AuthManager
+from app.extensions import auth_manager
+from app.utils.auth import invalidate_project_users
 from app.utils import (
     generate_uuid,
     associate_api_key_with_usage_plan,
     delete_api_key_from_aws,
     create_sns_topic,
     delete_sns_topic_from_aws,
+    invalidate_cached_counts,
 )
 
-token_manager = TokenManager()
-auth_manager = AuthManager(token_manager)
-
 bp = Blueprint("projects", __name__)
 
 
 @bp.route("", methods=["GET"])
-@auth_manager.authenticate
-@auth_manager.authorize_root
+@auth_manager.require(root=True)
 def get_projects() -> Response:
     """Fetches a paginated list of all projects."""
     page = request.args.get("page", 1, type=int)
     limit = request.args.get("limit", type=int)
 
-    current_app.logger.debug(f"Fetching projects with page={page}, limit={limit}")
+    current_app.logger.debug("Fetching projects with page=%s, limit=%s", page, limit)
 
     if page < 1 or (limit is not None and limit < 1):
         current_app.logger.error(
-            f"Invalid pagination parameters: page={page}, limit={limit}"
+            "Invalid pagination parameters: page=%s, limit=%s", page, limit
         )
         return (
             jsonify({"message": "Invalid pagination parameters."}),
@@ -49,17 +47,16 @@ def get_projects() -> Response:
     try:
         project_data = fetch_projects(page, limit)
         current_app.logger.info(
-            f"Fetched {len(project_data)} projects for page={page}, limit={limit}"
+            "Fetched %s projects for page=%s, limit=%s", len(project_data), page, limit
         )
         return jsonify({"payload": project_data}), 200
     except Exception as e:
-        current_app.logger.error(f"Failed to fetch projects: {e}", exc_info=True)
+        current_app.logger.error("Failed to fetch projects: %s", e, exc_info=True)
         return jsonify({"message": "Failed to fetch projects."}), 500
 
 
 @bp.route("", methods=["POST"])
-@auth_manager.authenticate
-@auth_manager.authorize_root
+@auth_manager.require(root=True)
 def create_project() -> Response:
     """Creates a new project with a unique project ID."""
     data = request.get_json()
@@ -74,10 +71,9 @@ def create_project() -> Response:
 
     if not name or not platform:
         current_app.logger.error(
-            (
-                f"Missing project name or platform in request: name={name}, "
-                f"platform={platform}"
-            )
+            "Missing project name or platform in request: name=%s, platform=%s",
+            name,
+            platform,
         )
         return (
             jsonify({"message": "Missing project name or platform."}),
@@ -85,17 +81,18 @@ def create_project() -> Response:
         )
 
     project_uuid = generate_uuid()
-    api_key = generate_uuid()
+    api_key = str(generate_uuid())
     current_app.logger.debug(
-        f"Generated UUID for project: {project_uuid} and API key: {api_key}"
+        "Generated UUID for project: %s and API key: %s", project_uuid, api_key
     )
 
     try:
         topic_arn = create_sns_topic(project_uuid)
         add_project(name, project_uuid, api_key, platform, topic_arn)
+        invalidate_cached_counts("projects")
         associate_api_key_with_usage_plan(name, api_key)
         current_app.logger.info(
-            f"Project created successfully: {name} ({project_uuid})"
+            "Project created successfully: %s (%s)", name, project_uuid
         )
 
         project_data = {
@@ -108,16 +105,15 @@ def create_project() -> Response:
 
         return jsonify({"payload": project_data}), 201
     except Exception as e:
-        current_app.logger.error(f"Failed to create project: {e}", exc_info=True)
+        current_app.logger.error("Failed to create project: %s", e, exc_info=True)
         return jsonify({"message": "Failed to create project."}), 500
 
 
 @bp.route("/<project_uuid>", methods=["DELETE"])
-@auth_manager.authenticate
-@auth_manager.authorize_root
+@auth_manager.require(root=True)
 def delete_project(project_uuid: str) -> Response:
     """Deletes a specified project by its project UUID."""
-    current_app.logger.debug(f"Received request to delete project: {project_uuid}")
+    current_app.logger.debug("Received request to delete project: %s", project_uuid)
 
     if not project_uuid:
         current_app.logger.error("Project identifier is required but missing.")
@@ -128,25 +124,27 @@ def delete_project(project_uuid: str) -> Response:
         api_key = delete_project_by_id(project_uuid)
 
         if api_key:
+            invalidate_project_users(project_uuid)
+            invalidate_cached_counts("projects")
+            invalidate_cached_counts("issues", project_uuid)
             delete_api_key_from_aws(api_key)
-            current_app.logger.info(f"Deleted project: {project_uuid}")
+            current_app.logger.info("Deleted project: %s", project_uuid)
             return "", 204
         else:
-            current_app.logger.warning(f"Project not found: {project_uuid}")
+            current_app.logger.warning("Project not found: %s", project_uuid)
             return jsonify({"message": "Project not found."}), 404
     except Exception as e:
         current_app.logger.error(
-            f"Failed to delete project UUID={project_uuid}: {e}", exc_info=True
+            "Failed to delete project UUID=%s: %s", project_uuid, e, exc_info=True
         )
         return jsonify({"message": "Failed to delete project."}), 500
 
 
 @bp.route("/<project_uuid>", methods=["PATCH"])
-@auth_manager.authenticate
-@auth_manager.authorize_root
+@auth_manager.require(root=True)
 def update_project(project_uuid: str) -> Response:
     """Updates the name of a specified project."""
-    current_app.logger.debug(f"Received request to update project: {project_uuid}")
+    current_app.logger.debug("Received request to update project: %s", project_uuid)
 
     if not project_uuid:
         current_app.logger.error("Project identifier is required but missing.")
@@ -168,14 +166,14 @@ def update_project(project_uuid: str) -> Response:
         success = update_project_name(project_uuid, new_name)
         if success:
             current_app.logger.info(
-                f"Updated project {project_uuid} with new name: {new_name}"
+                "Updated project %s with new name: %s", project_uuid, new_name
             )
             return "", 204
         else:
-            current_app.logger.warning(f"Project not found for update: {project_uuid}")
+            current_app.logger.warning("Project not found for update: %s", project_uuid)
             return jsonify({"message": "Project not found."}), 404
     except Exception as e:
         current_app.logger.error(
-            f"Failed to update project UUID={project_uuid}: {e}", exc_info=True
+            "Failed to update project UUID=%s: %s", project_uuid, e, exc_info=True
         )
         return jsonify({"message": "Failed to update project."}), 500
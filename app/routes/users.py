@@ -6,8 +6,8 @@ root access authorization, except for password updates, which require user sessi
 authentication.
 """
 
-import bcrypt
 from flask import Blueprint, jsonify, request, Response, g, current_app
+from pydantic import ValidationError
 from app.models import (
     fetch_all_users,
     add_user,
@@ -17,34 +17,37 @@ from app.models import (
     fetch_projects,
     fetch_user,
 )
-from app.utils import is_valid_email, generate_uuid
-from app.models import user_is_root
-from app.utils.auth import TokenManager, AuthManager
-
-token_manager = TokenManager()
-auth_manager = AuthManager(token_manager)
+from app.utils import (
+    is_valid_email,
+    is_valid_uuid,
+    generate_uuid,
+    hash_password,
+    cached_json_response,
+    invalidate_cached_response,
+    CreateUserPayload,
+)
+from app.extensions import auth_manager
+from app.utils.auth import invalidate_project_users, invalidate_user_root
 
 bp = Blueprint("users", __name__)
 
 
 @bp.route("", methods=["GET"])
-@auth_manager.authenticate
-@auth_manager.authorize_root
+@auth_manager.require(root=True)
 def get_users() -> Response:
     """Fetches a list of all users."""
     current_app.logger.debug("Fetching all users.")
     try:
-        users = fetch_all_users()
-        current_app.logger.info(f"Fetched {len(users)} users.")
-        return jsonify({"payload": users}), 200
+        response = cached_json_response(("users",), fetch_all_users)
+        current_app.logger.info("Fetched all users.")
+        return response
     except Exception as e:
-        current_app.logger.error(f"Failed to fetch users: {e}", exc_info=True)
+        current_app.logger.error("Failed to fetch users: %s", e, exc_info=True)
         return jsonify({"message": "Failed to fetch users."}), 500
 
 
 @bp.route("", methods=["POST"])
-@auth_manager.authenticate
-@auth_manager.authorize_root
+@auth_manager.require(root=True)
 def create_user() -> Response:
     """Creates a new user with specified attributes."""
     current_app.logger.debug("Received request to create a new user.")
@@ -54,39 +57,34 @@ def create_user() -> Response:
         current_app.logger.error("Invalid request: No JSON payload.")
         return jsonify({"message": "Invalid request."}), 400
 
-    first_name = data.get("first_name")
-    last_name = data.get("last_name")
-    email = data.get("email")
-    password = data.get("password")
-    confirmed_password = data.get("confirmed_password")
-
-    if (
-        not email
-        or not password
-        or not confirmed_password
-        or not first_name
-        or not last_name
-    ):
+    try:
+        payload = CreateUserPayload.model_validate(data)
+    except ValidationError:
         current_app.logger.error("Missing input data for user creation.")
         return (
             jsonify({"message": "Missing input data."}),
             400,
         )
 
-    if password != confirmed_password:
+    first_name = payload.first_name
+    last_name = payload.last_name
+    email = payload.email
+    password = payload.password
+
+    if password != payload.confirmed_password:
         current_app.logger.error("Password mismatch during user creation.")
         return jsonify({"message": "Passwords do not match."}), 400
 
     if not is_valid_email(email):
-        current_app.logger.error(f"Invalid email format: {email}")
+        current_app.logger.error("Invalid email format: %s", email)
         return jsonify({"message": "Invalid email format."}), 400
 
-    salt = bcrypt.gensalt()
-    password_hash = bcrypt.hashpw(password.encode("utf-8"), salt)
+    password_hash = hash_password(password)
     user_uuid = generate_uuid()
 
     try:
-        add_user(user_uuid, first_name, last_name, email, password_hash.decode("utf-8"))
+        add_user(user_uuid, first_name, last_name, email, password_hash)
+        invalidate_cached_response(("users",))
         user_info = {
             "uuid": user_uuid,
             "first_name": first_name,
@@ -95,22 +93,27 @@ def create_user() -> Response:
             "is_root": False,
         }
         current_app.logger.info(
-            f"User {first_name} {last_name} created successfully with UUID={user_uuid}."
+            "User %s %s created successfully with UUID=%s.",
+            first_name,
+            last_name,
+            user_uuid,
         )
         return (
             jsonify({"payload": user_info}),
             201,
         )
     except Exception as e:
-        current_app.logger.error(f"Failed to create user {email}: {e}", exc_info=True)
+        current_app.logger.error(
+            "Failed to create user %s: %s", email, e, exc_info=True
+        )
         return jsonify({"message": "Failed to create user."}), 500
 
 
 @bp.route("/me", methods=["GET"])
-@auth_manager.authenticate
+@auth_manager.require()
 def get_session_info() -> Response:
     user_uuid = g.user_payload.get("user_uuid")
-    current_app.logger.debug(f"Fetching session info for user UUID={user_uuid}.")
+    current_app.logger.debug("Fetching session info for user UUID=%s.", user_uuid)
 
     if not user_uuid:
         current_app.logger.error("User not found in session payload.")
@@ -121,26 +124,27 @@ def get_session_info() -> Response:
 
         if not user_info:
             current_app.logger.error(
-                f"User not found in database for UUID={user_uuid}."
+                "User not found in database for UUID=%s.", user_uuid
             )
             return jsonify({"message": "User not found."}), 404
 
-        current_app.logger.info(f"Fetched session info for user UUID={user_uuid}.")
+        current_app.logger.info("Fetched session info for user UUID=%s.", user_uuid)
         return jsonify({"payload": user_info}), 200
     except Exception as e:
         current_app.logger.error(
-            f"Failed to fetch session info for user UUID={user_uuid}: {e}",
+            "Failed to fetch session info for user UUID=%s: %s",
+            user_uuid,
+            e,
             exc_info=True,
         )
         return jsonify({"message": "Failed to fetch session info."}), 500
 
 
 @bp.route("/<user_uuid>", methods=["DELETE"])
-@auth_manager.authenticate
-@auth_manager.authorize_root
+@auth_manager.require(root=True)
 def delete_user(user_uuid: str) -> Response:
     """Deletes a specified user by their user ID."""
-    current_app.logger.debug(f"Received request to delete user UUID={user_uuid}.")
+    current_app.logger.debug("Received request to delete user UUID=%s.", user_uuid)
 
     if not user_uuid:
         current_app.logger.error("User identifier is required but missing.")
@@ -149,25 +153,30 @@ def delete_user(user_uuid: str) -> Response:
     try:
         success = delete_user_by_id(user_uuid)
         if success:
-            current_app.logger.info(f"User UUID={user_uuid} deleted successfully.")
+            invalidate_cached_response(("users",))
+            # Deleting a user also drops their project memberships.
+            invalidate_user_root(user_uuid)
+            invalidate_project_users()
+            current_app.logger.info("User UUID=%s deleted successfully.", user_uuid)
             return "", 204
         else:
-            current_app.logger.warning(f"User UUID={user_uuid} not found for deletion.")
+            current_app.logger.warning(
+                "User UUID=%s not found for deletion.", user_uuid
+            )
             return jsonify("User not found"), 404
     except Exception as e:
         current_app.logger.error(
-            f"Failed to delete user UUID={user_uuid}: {e}", exc_info=True
+            "Failed to delete user UUID=%s: %s", user_uuid, e, exc_info=True
         )
         return jsonify({"message": "Failed to delete user."}), 500
 
 
 @bp.route("/<user_uuid>", methods=["PATCH"])
-@auth_manager.authenticate
-@auth_manager.authorize_user
+@auth_manager.require(user=True)
 def update_user_password(user_uuid: str) -> Response:
     """Updates the password of a specified user."""
     current_app.logger.debug(
-        f"Received request to update password for user UUID={user_uuid}."
+        "Received request to update password for user UUID=%s.", user_uuid
     )
 
     if not user_uuid:
@@ -185,35 +194,35 @@ def update_user_password(user_uuid: str) -> Response:
         current_app.logger.error("New password is required but missing.")
         return jsonify({"message": "New password required."}), 400
 
-    password_hash = bcrypt.hashpw(
-        new_password.encode("utf-8"), bcrypt.gensalt()
-    ).decode("utf-8")
+    password_hash = hash_password(new_password)
 
     try:
         success = update_password(user_uuid, password_hash)
         if success:
             current_app.logger.info(
-                f"Password updated successfully for user UUID={user_uuid}."
+                "Password updated successfully for user UUID=%s.", user_uuid
             )
             return "", 204
         else:
             current_app.logger.warning(
-                f"User UUID={user_uuid} not found for password update."
+                "User UUID=%s not found for password update.", user_uuid
             )
             return jsonify({"message": "User not found"}), 404
     except Exception as e:
         current_app.logger.error(
-            f"Failed to update password for user UUID={user_uuid}: {e}", exc_info=True
+            "Failed to update password for user UUID=%s: %s",
+            user_uuid,
+            e,
+            exc_info=True,
         )
         return jsonify({"message": "Failed to update password."}), 500
 
 
 @bp.route("/<user_uuid>/projects", methods=["GET"])
-@auth_manager.authenticate
-@auth_manager.authorize_user
+@auth_manager.require(user=True)
 def get_user_projects(user_uuid: str) -> Response:
     """Retrieves all projects assigned to a specific user by user ID."""
-    current_app.logger.debug(f"Fetching projects for user UUID={user_uuid}.")
+    current_app.logger.debug("Fetching projects for user UUID=%s.", user_uuid)
 
     if not user_uuid:
         current_app.logger.error("User identifier is required but missing.")
@@ -221,36 +230,63 @@ def get_user_projects(user_uuid: str) -> Response:
 
     page = request.args.get("page", 1, type=int)
     limit = request.args.get("limit", 10, type=int)
+    after_name = request.args.get("after_name")
+    after_uuid = request.args.get("after_uuid")
 
-    current_app.logger.debug(f"Fetching user projects with page={page}, limit={limit}")
+    current_app.logger.debug(
+        "Fetching user projects with page=%s, limit=%s, after_name=%s, after_uuid=%s",
+        page,
+        limit,
+        after_name,
+        after_uuid,
+    )
 
     if page < 1 or limit < 1:
         current_app.logger.error(
-            f"Invalid pagination parameters: page={page}, limit={limit}"
+            "Invalid pagination parameters: page=%s, limit=%s", page, limit
         )
         return (
             jsonify({"message": "Invalid pagination parameters."}),
             400,
         )
 
+    if (after_name is None) != (after_uuid is None) or (
+        after_uuid is not None and not is_valid_uuid(after_uuid)
+    ):
+        current_app.logger.error(
+            "Invalid pagination cursor: after_name=%s, after_uuid=%s",
+            after_name,
+            after_uuid,
+        )
+        return (
+            jsonify({"message": "Invalid pagination parameters."}),
+            400,
+        )
+
+    # Unlike the user list and issue summary, this response is not kept in the
+    # response cache: pages are per user and per cursor, every ingested issue
+    # changes their issue counts, and the payload carries project API keys.
     try:
-        is_root = user_is_root(user_uuid)
-        current_app.logger.debug(f"User UUID={user_uuid} is_root={is_root}.")
+        # The path is the caller's own UUID, so their token already carries
+        # their root status.
+        is_root = g.user_payload.get("is_root")
+        current_app.logger.debug("User UUID=%s is_root=%s.", user_uuid, is_root)
 
         if is_root:
             project_data = fetch_projects(page, limit)
         else:
-            project_data = fetch_projects_for_user(user_uuid, page, limit)
+            project_data = fetch_projects_for_user(
+                user_uuid, limit, after_name, after_uuid
+            )
 
         current_app.logger.info(
-            (
-                f"Fetched {len(project_data['projects'])} projects for user "
-                f"UUID={user_uuid}."
-            )
+            "Fetched %s projects for user UUID=%s.",
+            len(project_data["projects"]),
+            user_uuid,
         )
         return jsonify({"payload": project_data}), 200
     except Exception as e:
         current_app.logger.error(
-            f"Failed to fetch projects for user UUID={user_uuid}: {e}", exc_info=True
+            "Failed to fetch projects for user UUID=%s: %s", user_uuid, e, exc_info=True
         )
         return jsonify({"message": "Failed to fetch user projects."}), 500
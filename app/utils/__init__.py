@@ -2,13 +2,23 @@
 
 from .db_helpers import (
     calculate_total_project_pages,
-    fetch_errors_by_project,
-    fetch_rejections_by_project,
+    fetch_issue_page,
     calculate_total_error_pages,
     calculate_total_user_project_pages,
+    count_pages,
+    PROJECT_ACCESS_PREDICATE,
 )
 from .uuid_generator import generate_uuid
-from .validation import is_valid_email
+from .validation import (
+    is_valid_email,
+    is_valid_uuid,
+    IssueQuery,
+    CreateUserPayload,
+)
+from .password_helpers import hash_password, check_password
+from .response_cache import cached_json_response, invalidate_cached_response
+from .count_cache import invalidate_cached_counts
+from .log_helpers import log_exception_sampled
 from .aws_helpers import (
     create_aws_client,
     get_secret,
@@ -23,12 +33,22 @@ from .aws_helpers import (
 
 __all__ = [
     "calculate_total_project_pages",
-    "fetch_errors_by_project",
-    "fetch_rejections_by_project",
+    "fetch_issue_page",
     "calculate_total_error_pages",
     "generate_uuid",
     "is_valid_email",
+    "is_valid_uuid",
+    "IssueQuery",
+    "CreateUserPayload",
+    "hash_password",
+    "check_password",
+    "cached_json_response",
+    "invalidate_cached_response",
+    "invalidate_cached_counts",
+    "log_exception_sampled",
     "calculate_total_user_project_pages",
+    "count_pages",
+    "PROJECT_ACCESS_PREDICATE",
     "create_aws_client",
     "get_secret",
     "associate_api_key_with_usage_plan",
@@ -2,5 +2,18 @@
 
 from .token_manager import TokenManager
 from .auth_manager import AuthManager
+from .auth_cache import (
+    cached_fetch_project_users,
+    cached_user_is_root,
+    invalidate_project_users,
+    invalidate_user_root,
+)
 
-__all__ = ["TokenManager", "AuthManager"]
+__all__ = [
+    "TokenManager",
+    "AuthManager",
+    "cached_fetch_project_users",
+    "cached_user_is_root",
+    "invalidate_project_users",
+    "invalidate_user_root",
+]
@@ -0,0 +1,122 @@
+"""Authorization lookup caches.
+
+Project membership and root status are checked on nearly every request but rarely
+change. Lookups are cached per process for a short TTL and memoized on `flask.g` for
+the rest of the request. Concurrent misses for the same entry share a single
+lookup. Routes that change memberships or users invalidate the affected entries.
+"""
+
+from concurrent.futures import Future
+from threading import RLock
+from typing import Any, Callable, FrozenSet, Hashable
+from cachetools import TTLCache
+from flask import g
+from app.models import fetch_project_users, user_is_root
+
+PROJECT_USERS_TTL = 60
+USER_ROOT_TTL = 120
+
+_project_users_cache = TTLCache(maxsize=4096, ttl=PROJECT_USERS_TTL)
+_user_root_cache = TTLCache(maxsize=4096, ttl=USER_ROOT_TTL)
+_cache_lock = RLock()
+_in_flight = {}
+_missing = object()
+
+
+def _request_cache() -> dict:
+    if "auth_cache" not in g:
+        g.auth_cache = {}
+    return g.auth_cache
+
+
+def _cached_lookup(
+    cache: TTLCache, kind: str, key: Hashable, fetch: Callable[[Hashable], Any]
+) -> Any:
+    request_cache = _request_cache()
+    request_key = (kind, key)
+    if request_key in request_cache:
+        return request_cache[request_key]
+
+    with _cache_lock:
+        value = cache.get(key, _missing)
+
+    if value is _missing:
+        value = _fetch_once(cache, kind, key, fetch)
+
+    request_cache[request_key] = value
+    return value
+
+
+def _fetch_once(
+    cache: TTLCache, kind: str, key: Hashable, fetch: Callable[[Hashable], Any]
+) -> Any:
+    # The first caller to miss runs the lookup; callers that miss while it is in
+    # flight wait for its result instead of querying the database themselves.
+    flight_key = (kind, key)
+    with _cache_lock:
+        value = cache.get(key, _missing)
+        if value is not _missing:
+            return value
+        future = _in_flight.get(flight_key)
+        is_leader = future is None
+        if is_leader:
+            future = _in_flight[flight_key] = Future()
+
+    if not is_leader:
+        return future.result()
+
+    try:
+        value = fetch(key)
+    except BaseException as e:
+        with _cache_lock:
+            if _in_flight.get(flight_key) is future:
+                del _in_flight[flight_key]
+        future.set_exception(e)
+        raise
+
+    with _cache_lock:
+        # An invalidation during the lookup drops the flight; its possibly stale
+        # result is still handed to the waiting callers but is not cached.
+        if _in_flight.get(flight_key) is future:
+            del _in_flight[flight_key]
+            cache[key] = value
+    future.set_result(value)
+    return value
+
+
+def _fetch_project_user_set(project_uuid: str) -> FrozenSet[str]:
+    return frozenset(fetch_project_users(project_uuid))
+
+
+def cached_fetch_project_users(project_uuid: str) -> FrozenSet[str]:
+    """Returns the UUIDs of the users assigned to a project, as a set for
+    membership checks."""
+    return _cached_lookup(
+        _project_users_cache, "project_users", project_uuid, _fetch_project_user_set
+    )
+
+
+def cached_user_is_root(user_uuid: str) -> bool:
+    """Returns whether a user has root access."""
+    return _cached_lookup(_user_root_cache, "user_root", user_uuid, user_is_root)
+
+
+def invalidate_project_users(project_uuid: str = None) -> None:
+    """Drops the cached users of a project, or of every project if none is given."""
+    with _cache_lock:
+        if project_uuid is None:
+            _project_users_cache.clear()
+            for flight_key in [k for k in _in_flight if k[0] == "project_users"]:
+                del _in_flight[flight_key]
+        else:
+            _project_users_cache.pop(project_uuid, None)
+            _in_flight.pop(("project_users", project_uuid), None)
+    g.pop("auth_cache", None)
+
+
+def invalidate_user_root(user_uuid: str) -> None:
+    """Drops a user's cached root status."""
+    with _cache_lock:
+        _user_root_cache.pop(user_uuid, None)
+        _in_flight.pop(("user_root", user_uuid), None)
+    g.pop("auth_cache", None)
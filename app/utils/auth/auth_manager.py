@@ -2,164 +2,170 @@ import jwt
 from flask import request, g, jsonify, current_app
 from functools import wraps
 from .token_manager import TokenManager
-from app.models import fetch_project_users
+from .auth_cache import cached_fetch_project_users
+from app.utils.validation import is_valid_uuid
 
 
 class AuthManager:
+    __slots__ = ("token_manager",)
+
     def __init__(self, token_manager: TokenManager):
         self.token_manager = token_manager
 
-    # Authentication decorator
-    def authenticate(self, f):
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            token = self._get_token()
-            if not token:
-                current_app.logger.info("Authentication failed: Missing token.")
-                return (
-                    jsonify({"message": "Authentication required. Please log in."}),
-                    401,
-                )
-            try:
-                g.user_payload = self.token_manager.decode_token(token)
-            except jwt.ExpiredSignatureError:
-                current_app.logger.info("Authentication failed: Token expired.")
-                return (
-                    jsonify({"message": "Session expired. Please log in again."}),
-                    401,
-                )
-            except jwt.InvalidTokenError:
-                current_app.logger.info("Authentication failed: Invalid token.")
-                return (
-                    jsonify({"message": "Invalid session. Please log in again."}),
-                    401,
-                )
-            except Exception as e:
-                current_app.logger.error(
-                    f"Unexpected error during token authentication: {e}", exc_info=True
-                )
-                return jsonify({"message": "Internal server error."}), 500
-
-            return f(*args, **kwargs)
-
-        return decorated_function
-
-    # Root authorization decorator
-    def authorize_root(self, f):
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            if g.user_payload.get("is_root"):
-                current_app.logger.debug("Root access granted.")
-                return f(*args, **kwargs)
-
-            current_app.logger.info(
-                "Authorization failed: User lacks root permissions."
-            )
-            return (
-                jsonify(
-                    {
-                        "message": (
-                            "You do not have the necessary permissions "
-                            "to perform this action."
+    # Authentication and authorization decorator
+    def require(self, *, root=False, project=False, user=False):
+        """Authenticates the request and checks the requested access in a single
+        wrapper: `root` requires a root user, `project` requires access to the
+        `project_uuid` in the path, and `user` requires the `user_uuid` in the path
+        to be the current user. Malformed UUIDs in the path are rejected with a 404
+        before they reach the database."""
+
+        def decorator(f):
+            @wraps(f)
+            def decorated_function(*args, **kwargs):
+                error_response = self._authenticate()
+                if error_response:
+                    return error_response
+
+                user_payload = g.user_payload
+                current_user_uuid = user_payload.get("user_uuid")
+                is_root = user_payload.get("is_root")
+
+                error_response = self._validate_path_uuids(kwargs)
+                if error_response:
+                    return error_response
+
+                if root:
+                    if not is_root:
+                        current_app.logger.info(
+                            "Authorization failed: User lacks root permissions."
                         )
-                    }
-                ),
-                403,
-            )
+                        return self._forbidden()
 
-        return decorated_function
+                    current_app.logger.debug("Root access granted.")
 
-    # Project authorization decorator
-    def authorize_project_access(self, f):
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            user_uuid = g.user_payload.get("user_uuid")
-            is_root = g.user_payload.get("is_root")
-            project_uuid = kwargs.get("project_uuid")
+                if project:
+                    error_response = self._authorize_project_access(
+                        current_user_uuid, is_root, kwargs.get("project_uuid")
+                    )
+                    if error_response:
+                        return error_response
+
+                if user:
+                    if current_user_uuid != kwargs.get("user_uuid"):
+                        current_app.logger.info(
+                            "Authorization failed: User UUID=%s attempted to access "
+                            "another user's settings.",
+                            current_user_uuid,
+                        )
+                        return self._forbidden()
 
-            if not project_uuid:
-                current_app.logger.error(
-                    "Authorization failed: Missing project_uuid in request."
-                )
-                return jsonify({"message": "Project identifier is required."}), 400
+                    current_app.logger.debug(
+                        "Access granted for user UUID=%s.", current_user_uuid
+                    )
 
-            # Allow root users universal access
-            if is_root:
-                current_app.logger.debug(
-                    f"Root access granted for project UUID={project_uuid}."
-                )
                 return f(*args, **kwargs)
 
-            try:
-                # Project-specific access for non-root users
-                project_users = fetch_project_users(project_uuid)
+            return decorated_function
 
-                if user_uuid in project_users:
-                    current_app.logger.debug(
-                        (
-                            f"Access granted to user UUID={user_uuid} for project "
-                            f"UUID={project_uuid}."
-                        )
-                    )
-                    return f(*args, **kwargs)
+        return decorator
 
-                current_app.logger.info(
-                    (
-                        f"Authorization failed: User UUID={user_uuid} not assigned to "
-                        f"project UUID={project_uuid}."
-                    )
-                )
-                return (
-                    jsonify(
-                        {
-                            "message": (
-                                "You do not have the necessary permissions to perform "
-                                "this action."
-                            )
-                        }
-                    ),
-                    403,
-                )
-            except Exception as e:
-                current_app.logger.error(
-                    f"Unexpected error during project authorization: {e}", exc_info=True
-                )
-                return jsonify({"message": "Internal server error."}), 500
+    def _authenticate(self):
+        token = self._get_token()
+        if not token:
+            current_app.logger.info("Authentication failed: Missing token.")
+            return (
+                jsonify({"message": "Authentication required. Please log in."}),
+                401,
+            )
+        try:
+            g.user_payload = self.token_manager.decode_token(token)
+        except jwt.ExpiredSignatureError:
+            current_app.logger.info("Authentication failed: Token expired.")
+            return (
+                jsonify({"message": "Session expired. Please log in again."}),
+                401,
+            )
+        except jwt.InvalidTokenError:
+            current_app.logger.info("Authentication failed: Invalid token.")
+            return (
+                jsonify({"message": "Invalid session. Please log in again."}),
+                401,
+            )
+        except Exception as e:
+            current_app.logger.error(
+                "Unexpected error during token authentication: %s", e, exc_info=True
+            )
+            return jsonify({"message": "Internal server error."}), 500
+
+        return None
+
+    def authorize_project_access(self, project_uuid):
+        """Checks the current user's access to a project, returning an error
+        response if access is denied and None otherwise."""
+        user_payload = g.user_payload
+        return self._authorize_project_access(
+            user_payload.get("user_uuid"), user_payload.get("is_root"), project_uuid
+        )
+
+    def _validate_path_uuids(self, path_params):
+        for name, value in path_params.items():
+            if name.endswith("_uuid") and value and not is_valid_uuid(value):
+                current_app.logger.info("Malformed %s in request path: %s", name, value)
+                return jsonify({"message": "Resource not found."}), 404
+
+        return None
+
+    def _authorize_project_access(self, user_uuid, is_root, project_uuid):
+        if not project_uuid:
+            current_app.logger.error(
+                "Authorization failed: Missing project_uuid in request."
+            )
+            return jsonify({"message": "Project identifier is required."}), 400
 
-        return decorated_function
+        # Allow root users universal access
+        if is_root:
+            current_app.logger.debug(
+                "Root access granted for project UUID=%s.", project_uuid
+            )
+            return None
 
-    # User-specific operation authorization decorator
-    def authorize_user(self, f):
-        @wraps(f)
-        def decorated_function(*args, **kwargs):
-            user_uuid_in_path = kwargs.get("user_uuid")
-            current_user_uuid = g.user_payload.get("user_uuid")
+        try:
+            # Project-specific access for non-root users
+            project_users = cached_fetch_project_users(project_uuid)
 
-            if current_user_uuid == user_uuid_in_path:
+            if user_uuid in project_users:
                 current_app.logger.debug(
-                    f"Access granted for user UUID={current_user_uuid}."
+                    "Access granted to user UUID=%s for project UUID=%s.",
+                    user_uuid,
+                    project_uuid,
                 )
-                return f(*args, **kwargs)
+                return None
 
             current_app.logger.info(
-                (
-                    f"Authorization failed: User UUID={current_user_uuid} attempted to "
-                    f"access another user's settings."
-                )
+                "Authorization failed: User UUID=%s not assigned to project UUID=%s.",
+                user_uuid,
+                project_uuid,
             )
-            return (
-                jsonify(
-                    {
-                        "message": (
-                            "You do not have the necessary permissions to perform "
-                            "this action."
-                        )
-                    }
-                ),
-                403,
+            return self._forbidden()
+        except Exception as e:
+            current_app.logger.error(
+                "Unexpected error during project authorization: %s", e, exc_info=True
             )
-
-        return decorated_function
+            return jsonify({"message": "Internal server error."}), 500
+
+    def _forbidden(self):
+        return (
+            jsonify(
+                {
+                    "message": (
+                        "You do not have the necessary permissions to perform "
+                        "this action."
+                    )
+                }
+            ),
+            403,
+        )
 
     def _get_token(self):
         auth_header = request.headers.get("Authorization")
@@ -167,9 +173,9 @@ class AuthManager:
             current_app.logger.warning("Authorization header missing.")
             return None
 
-        parts = auth_header.split()
-        if len(parts) != 2 or parts[0].lower() != "bearer":
+        scheme, _, token = auth_header.partition(" ")
+        if scheme.lower() != "bearer" or not token or " " in token:
             current_app.logger.warning("Malformed Authorization header.")
             return None
 
-        return parts[1]
+        return token
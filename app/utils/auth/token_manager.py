@@ -1,45 +1,146 @@
 import jwt
-import datetime
-from flask import request, current_app
-from app.models import user_is_root
+import time
+import hmac
+import base64
+import hashlib
+import binascii
+import orjson
+from threading import RLock
+from cachetools import TLRUCache
+from flask import request, current_app, g
+from .auth_cache import cached_user_is_root
+
+# Verified payloads are cached by a digest of the signing key and token, so repeat
+# requests with the same token skip signature verification. An entry lives until
+# its token expires, and never longer than TOKEN_CACHE_MAX_AGE seconds.
+TOKEN_CACHE_MAX_AGE = 300
+
+_ALGORITHM = "HS256"
+
+
+def _token_cache_expiry(_key, payload, now):
+    exp = payload.get("exp")
+    if exp is None:
+        return now + TOKEN_CACHE_MAX_AGE
+    return min(exp, now + TOKEN_CACHE_MAX_AGE)
+
+
+_token_cache = TLRUCache(maxsize=10_000, ttu=_token_cache_expiry, timer=time.time)
+_token_cache_lock = RLock()
+
+
+def _token_cache_key(token, secret_key):
+    return hashlib.blake2b(f"{secret_key}.{token}".encode(), digest_size=16).digest()
+
+
+def _b64url_json(segment):
+    try:
+        value = orjson.loads(
+            base64.urlsafe_b64decode(segment + b"=" * (-len(segment) % 4))
+        )
+    except (binascii.Error, orjson.JSONDecodeError) as e:
+        raise jwt.DecodeError(f"Invalid token segment: {e}") from e
+    if not isinstance(value, dict):
+        raise jwt.DecodeError("Invalid token segment: not a JSON object")
+    return value
+
+
+def _decode_hs256(token, secret_key):
+    """Verifies an HS256 token and returns its payload.
+
+    Only the checks this app relies on are made: the header must name HS256, the
+    signature must match, exp is required and nbf is honoured. Failures raise the
+    same PyJWT exceptions jwt.decode would.
+    """
+    if isinstance(token, str):
+        token = token.encode()
+
+    try:
+        header_segment, payload_segment, signature = token.split(b".")
+        signing_input = header_segment + b"." + payload_segment
+        signature = base64.urlsafe_b64decode(signature + b"=" * (-len(signature) % 4))
+    except (ValueError, binascii.Error) as e:
+        raise jwt.DecodeError("Not enough segments") from e
+
+    if _b64url_json(header_segment).get("alg") != _ALGORITHM:
+        raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+
+    expected = hmac.digest(secret_key.encode(), signing_input, hashlib.sha256)
+    if not hmac.compare_digest(expected, signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+
+    payload = _b64url_json(payload_segment)
+    now = time.time()
+
+    exp = payload.get("exp")
+    if exp is None:
+        raise jwt.MissingRequiredClaimError("exp")
+    if not isinstance(exp, (int, float)) or isinstance(exp, bool):
+        raise jwt.DecodeError("Expiration Time claim (exp) must be an integer.")
+    if exp <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+    nbf = payload.get("nbf")
+    if nbf is not None and not (isinstance(nbf, (int, float)) and nbf <= now):
+        raise jwt.ImmatureSignatureError("The token is not yet valid (nbf)")
+
+    return payload
 
 
 class TokenManager:
+    __slots__ = ()
+
     def create_access_token(self, user_uuid, is_root, expires_in=20):
         token_payload = {
             "user_uuid": user_uuid,
             "is_root": is_root,
-            "exp": datetime.datetime.utcnow() + datetime.timedelta(minutes=expires_in),
+            "exp": int(time.time()) + expires_in * 60,
         }
 
         token = jwt.encode(
             token_payload,
             current_app.config["JWT_SECRET_KEY"],
-            algorithm="HS256",
+            algorithm=_ALGORITHM,
         )
-        current_app.logger.debug(f"Access token created for user_uuid={user_uuid}.")
+        current_app.logger.debug("Access token created for user_uuid=%s.", user_uuid)
         return token
 
     def create_refresh_token(self, user_uuid, expires_in=7):
         token_payload = {
             "user_uuid": user_uuid,
-            "exp": datetime.datetime.utcnow() + datetime.timedelta(days=expires_in),
+            "exp": int(time.time()) + expires_in * 86400,
         }
 
         token = jwt.encode(
             token_payload,
             current_app.config["JWT_SECRET_KEY"],
-            algorithm="HS256",
+            algorithm=_ALGORITHM,
         )
-        current_app.logger.debug(f"Refresh token created for user_uuid={user_uuid}.")
+        current_app.logger.debug("Refresh token created for user_uuid=%s.", user_uuid)
         return token
 
     def decode_token(self, token):
-        payload = jwt.decode(
-            token, current_app.config["JWT_SECRET_KEY"], algorithms=["HS256"]
-        )
+        # Payloads are memoized on `flask.g` for the rest of the request, then in
+        # the process-wide token cache.
+        request_tokens = g.setdefault("decoded_tokens", {})
+        payload = request_tokens.get(token)
+
+        if payload is None:
+            secret_key = current_app.config["JWT_SECRET_KEY"]
+            cache_key = _token_cache_key(token, secret_key)
+
+            with _token_cache_lock:
+                payload = _token_cache.get(cache_key)
+
+            if payload is None:
+                payload = _decode_hs256(token, secret_key)
+                with _token_cache_lock:
+                    _token_cache[cache_key] = payload
+
+            request_tokens[token] = payload
+
         current_app.logger.debug("Token decoded successfully.")
-        return payload
+        return dict(payload)
 
     def refresh_access_token(self):
         refresh_token = request.cookies.get("refresh_token")
@@ -50,7 +151,7 @@ class TokenManager:
         try:
             payload = self.decode_token(refresh_token)
             user_uuid = payload["user_uuid"]
-            is_root = user_is_root(user_uuid)
+            is_root = cached_user_is_root(user_uuid)
 
             new_access_token = self.create_access_token(user_uuid, is_root)
             return new_access_token, None
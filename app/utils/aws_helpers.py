@@ -1,10 +1,17 @@
 from flask import current_app, Response
 import logging
+from threading import RLock
 import boto3
 import botocore.exceptions
+from cachetools import TTLCache, cached
 
 logger = logging.getLogger()
 
+# Fetched secrets are reused for this many seconds, so rebuilding the app in the
+# same process does not go back to Secrets Manager while staying well inside any
+# rotation window.
+SECRET_CACHE_TTL = 15 * 60
+
 
 def create_aws_client(service: str, region: str) -> boto3.client:
     """Instantiates a boto3 client for a specific AWS service"""
@@ -21,8 +28,9 @@ def create_aws_client(service: str, region: str) -> boto3.client:
         raise RuntimeError(f"Error creating AWS client for {service}: {str(e)}")
 
 
+@cached(cache=TTLCache(maxsize=32, ttl=SECRET_CACHE_TTL), lock=RLock())
 def get_secret(secret_name: str, region: str) -> str:
-    """Fetch a secret from AWS Secrets Manager."""
+    """Fetch a secret from AWS Secrets Manager. Failed fetches are not cached."""
     try:
         session = boto3.session.Session()
         client = session.client(service_name="secretsmanager", region_name=region)
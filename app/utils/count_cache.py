@@ -0,0 +1,37 @@
+"""Row count cache for paginated listings.
+
+Listings report a page count, which needs an exact COUNT(*) over every matching
+row, while the rows themselves only need an index range scan. Counts tolerate
+brief staleness, so they are cached per process for a short TTL. Routes that add
+or remove the counted rows invalidate the affected counts.
+"""
+
+from threading import RLock
+from typing import Hashable, Optional, Tuple
+from cachetools import TTLCache
+
+COUNT_CACHE_TTL = 30
+
+_count_cache = TTLCache(maxsize=4096, ttl=COUNT_CACHE_TTL)
+_count_cache_lock = RLock()
+
+
+def get_cached_count(key: Tuple[Hashable, ...]) -> Optional[int]:
+    """Returns the cached count for `key`, or None if it is not cached."""
+    with _count_cache_lock:
+        return _count_cache.get(key)
+
+
+def set_cached_count(key: Tuple[Hashable, ...], count: int) -> None:
+    """Caches `count` under `key`."""
+    with _count_cache_lock:
+        _count_cache[key] = count
+
+
+def invalidate_cached_counts(*scope: Hashable) -> None:
+    """Drops every cached count whose key starts with `scope`, e.g.
+    `invalidate_cached_counts("issues", project_uuid)`."""
+    size = len(scope)
+    with _count_cache_lock:
+        for key in [key for key in _count_cache if key[:size] == scope]:
+            del _count_cache[key]
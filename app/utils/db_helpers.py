@@ -1,8 +1,49 @@
 """Database helper functions for projects and logs."""
 
-import math
-from typing import Optional, List, Dict
+from datetime import datetime
+from typing import Optional, List, Dict, Tuple
 from psycopg2.extensions import cursor as Cursor
+from db import execute_prepared
+from .count_cache import get_cached_count, set_cached_count
+
+# Above this many rows, paginated listings skip the exact count and only report
+# whether another page exists.
+SIMPLE_PAGINATION_THRESHOLD = 1000
+
+# Columns of a merged issue page that only apply to errors.
+ERROR_ONLY_COLUMNS = (
+    "name",
+    "message",
+    "file",
+    "line_number",
+    "col_number",
+    "error_hash",
+    "total_occurrences",
+    "distinct_users",
+)
+
+# Restricts a query joined to `projects p` to projects the caller can access. Takes
+# two parameters: the caller's root status and their user UUID.
+PROJECT_ACCESS_PREDICATE = """
+(
+    %s OR EXISTS (
+        SELECT 1
+        FROM projects_users pu
+        JOIN users u ON pu.user_id = u.id
+        WHERE pu.project_id = p.id AND u.uuid = %s
+    )
+)
+"""
+
+
+def count_pages(total_count: int, limit: int) -> int:
+    """Returns how many pages of `limit` items hold `total_count` items, using
+    integer arithmetic. A non-positive `limit` means a single unpaginated page."""
+    if not total_count:
+        return 0
+    if limit < 1:
+        return 1
+    return -(-total_count // limit)
 
 
 def calculate_total_project_pages(cursor: Cursor, limit: int) -> int:
@@ -10,177 +51,213 @@ def calculate_total_project_pages(cursor: Cursor, limit: int) -> int:
     if not limit:
         return 1
 
-    query = "SELECT COUNT(DISTINCT p.id) FROM projects p;"
+    total_count = get_cached_count(("projects",))
+
+    if total_count is None:
+        query = "SELECT COUNT(DISTINCT p.id) AS total_count FROM projects p;"
+
+        cursor.execute(query)
+        total_count = cursor.fetchone()["total_count"]
+        set_cached_count(("projects",), total_count)
 
-    cursor.execute(query)
-    total_count = cursor.fetchone()[0]
-    total_pages = math.ceil(total_count / limit)
+    total_pages = count_pages(total_count, limit)
 
     return total_pages
 
 
 def calculate_total_user_project_pages(
-    cursor: Cursor, user_uuid: int, limit: int
-) -> int:
+    cursor: Cursor, user_uuid: str, limit: int
+) -> Optional[int]:
     """Calculates the total number of pages for a paginated list of projects
-    a certain user is assigned to."""
+    a certain user is assigned to, or None if the user has more than
+    SIMPLE_PAGINATION_THRESHOLD projects."""
 
     query = """
-    SELECT COUNT(DISTINCT p.id)
-    FROM projects p
-    JOIN projects_users pu ON p.id = pu.project_id
-    JOIN users u ON pu.user_id = u.id
-    WHERE u.uuid = %s;
+    SELECT COUNT(*) AS total_count
+    FROM (
+        SELECT 1
+        FROM projects_users pu
+        JOIN users u ON pu.user_id = u.id
+        WHERE u.uuid = %s
+        LIMIT %s
+    ) AS capped;
     """
 
-    cursor.execute(query, (user_uuid,))
-    total_count = cursor.fetchone()[0]
-    total_pages = math.ceil(total_count / limit)
+    cursor.execute(query, (user_uuid, SIMPLE_PAGINATION_THRESHOLD + 1))
+    total_count = cursor.fetchone()["total_count"]
+
+    if total_count > SIMPLE_PAGINATION_THRESHOLD:
+        return None
+
+    total_pages = count_pages(total_count, limit)
 
     return total_pages
 
 
-def fetch_errors_by_project(
-    cursor: Cursor,
-    project_uuid: str,
-    page: int,
-    limit: int,
-    handled: Optional[bool],
-    time: Optional[str],
-    resolved: Optional[bool],
-) -> List[Dict[str, int]]:
-    """Retrieves error logs for a specific project, with optional filters and
-    pagination."""
+def _issue_filters(alias: str) -> str:
+    """Returns the optional filter conditions for an issue table alias.
 
-    # Base query
-    query = """
+    Filters are bound as `$2` (handled), `$3` (resolved) and `$4` (time); a NULL
+    parameter disables its filter, so one prepared statement serves every
+    combination of filters.
+    """
+    return f"""
+            AND ($2::boolean IS NULL OR {alias}.handled = $2)
+            AND ($3::boolean IS NULL OR {alias}.resolved = $3)
+            AND ($4::timestamptz IS NULL OR {alias}.created_at >= $4)"""
+
+
+# Counts every issue matching the filters of an issue query.
+ISSUE_COUNT = f"""
+        (
+            SELECT COUNT(*)
+            FROM error_logs e
+            WHERE e.project_id = (SELECT id FROM project){_issue_filters("e")}
+        )
+        + (
+            SELECT COUNT(*)
+            FROM rejection_logs r
+            WHERE r.project_id = (SELECT id FROM project){_issue_filters("r")}
+        )"""
+
+
+def _issue_page_query(seek: bool, count: bool) -> str:
+    """Returns the merged issue page query.
+
+    Offset pages bind `$5` (rows to read from each log), `$6` (page size) and `$7`
+    (offset). Seek pages additionally bind `$8` and `$9`, the `created_at` and
+    `uuid` of the last issue already seen, and only read rows that sort after it.
+    Without `count`, the `total_count` column is NULL.
+    """
+    error_seek = " AND (e.created_at, e.uuid) < ($8, $9)" if seek else ""
+    rejection_seek = " AND (r.created_at, r.uuid) < ($8, $9)" if seek else ""
+    total_count = ISSUE_COUNT if count else " NULL::bigint"
+
+    return f"""
+    WITH project AS (
+        SELECT id FROM projects WHERE uuid = $1
+    ),
+    page AS (
+        (
+            SELECT
+                'error' AS kind, e.uuid, e.name, e.message, e.created_at,
+                e.filename AS file, e.line_number, e.col_number, e.handled,
+                e.resolved, e.error_hash, NULL AS value
+            FROM error_logs e
+            WHERE e.project_id = (SELECT id FROM project){_issue_filters("e")}
+            {error_seek}
+            ORDER BY e.created_at DESC, e.uuid DESC
+            LIMIT $5
+        )
+        UNION ALL
+        (
+            SELECT
+                'rejection', r.uuid, NULL, NULL, r.created_at, NULL, NULL, NULL,
+                r.handled, r.resolved, NULL, r.value
+            FROM rejection_logs r
+            WHERE r.project_id = (SELECT id FROM project){_issue_filters("r")}
+            {rejection_seek}
+            ORDER BY r.created_at DESC, r.uuid DESC
+            LIMIT $5
+        )
+        ORDER BY created_at DESC, uuid DESC
+        LIMIT $6 OFFSET $7
+    )
     SELECT
-        e.uuid, e.name, e.message, e.created_at, e.filename, e.line_number,
-        e.col_number, e.handled, e.resolved, e.error_hash
-    FROM error_logs e
-    JOIN projects p ON e.project_id = p.id
-    WHERE p.uuid = %s
+        page.*,
+        stats.total_occurrences,
+        stats.distinct_users,{total_count} AS total_count
+    FROM page
+    LEFT JOIN LATERAL (
+        SELECT
+            COUNT(*) AS total_occurrences,
+            COUNT(DISTINCT s.ip) AS distinct_users
+        FROM error_logs s
+        WHERE s.project_id = (SELECT id FROM project)
+        AND s.error_hash = page.error_hash
+    ) stats ON page.kind = 'error'
+    ORDER BY page.created_at DESC, page.uuid DESC
     """
 
-    params = [project_uuid]
-
-    # Add optional filters to query
-    if handled is not None:
-        query += " AND e.handled = %s"
-        params.append(handled)
-    if resolved is not None:
-        query += " AND e.resolved = %s"
-        params.append(resolved)
-    if time is not None:
-        query += " AND e.created_at >= %s"
-        params.append(time)
-
-    # Add sorting and pagination
-    offset = (page - 1) * limit
-    query += " ORDER BY e.created_at DESC LIMIT %s OFFSET %s"
-    params.extend([limit, offset])
-
-    cursor.execute(query, params)
-    rows = cursor.fetchall()
 
-    error_hashes = [row[9] for row in rows]
+# Prepared statement names and queries, keyed by (seek, count).
+ISSUE_PAGE_QUERIES = {
+    (seek, count): (
+        "fetch_issue_page" + ("_after" if seek else "") + ("" if count else "_only"),
+        _issue_page_query(seek, count),
+    )
+    for seek in (False, True)
+    for count in (False, True)
+}
+
+COUNT_ISSUES_QUERY = f"""
+    WITH project AS (
+        SELECT id FROM projects WHERE uuid = $1
+    )
+    SELECT{ISSUE_COUNT} AS total_count
+    """
 
-    if error_hashes:
-        stats_query = """
-        SELECT
-            e.error_hash,
-            COUNT(*) AS total_occurrences,
-            COUNT(DISTINCT e.ip) AS distinct_users
-        FROM error_logs e
-        JOIN projects p ON e.project_id = p.id
-        WHERE p.uuid = %s AND e.error_hash IN %s
-        GROUP BY e.error_hash
-        """
-
-        cursor.execute(stats_query, [project_uuid, tuple(error_hashes)])
-        stats = cursor.fetchall()
-        stats_map = {
-            stat[0]: {"total_occurrences": stat[1], "distinct_users": stat[2]}
-            for stat in stats
-        }
-    else:
-        stats_map = {}
-
-    errors = [
-        {
-            "uuid": row[0],
-            "name": row[1],
-            "message": row[2],
-            "created_at": row[3],
-            "file": row[4],
-            "line_number": row[5],
-            "col_number": row[6],
-            "project_uuid": project_uuid,
-            "handled": row[7],
-            "resolved": row[8],
-            "total_occurrences": stats_map.get(row[9], {}).get("total_occurrences", 0),
-            "distinct_users": stats_map.get(row[9], {}).get("distinct_users", 0),
-        }
-        for row in rows
-    ]
-
-    return errors
-
-
-def fetch_rejections_by_project(
+
+def fetch_issue_page(
     cursor: Cursor,
     project_uuid: str,
     page: int,
     limit: int,
     handled: Optional[bool],
-    time: Optional[str],
+    time: Optional[datetime],
     resolved: Optional[bool],
-) -> List[Dict[str, int]]:
-    """Retrieves rejection logs for a specific project, with optional filters and
-    pagination."""
-
-    # Base query
-    query = """
-    SELECT
-        r.uuid, r.value, r.created_at, r.handled, r.resolved
-    FROM rejection_logs r
-    JOIN projects p ON r.project_id = p.id
-    WHERE p.uuid = %s
+    after: Optional[Tuple[datetime, str]] = None,
+) -> Tuple[List[Dict], Optional[int], bool]:
+    """Retrieves one page of a project's errors and rejections, newest first, with
+    optional filters.
+
+    Pages are selected by `page`, or, when `after` holds the `created_at` and
+    `uuid` of the last issue of the previous page, by seeking past that issue,
+    which costs the same however deep the page is.
+
+    A single statement resolves the project once, merges both logs and attaches
+    the occurrence stats of each error. Unless a recent count of the matching
+    issues is cached, it counts them too. Returns the page's issues, that count,
+    which is None when the page is empty and no count is cached, and whether
+    another page follows.
     """
+    filters = (project_uuid, handled, resolved, time)
+    count_key = ("issues", *filters)
+    total_count = get_cached_count(count_key)
+    name, query = ISSUE_PAGE_QUERIES[after is not None, total_count is None]
+
+    # One row past the page is read to tell whether another page follows.
+    if after is None:
+        offset = (page - 1) * limit
+        params = (*filters, offset + limit + 1, limit + 1, offset)
+    else:
+        params = (*filters, limit + 1, limit + 1, 0, *after)
 
-    params = [project_uuid]
-
-    # Add optional filters to query
-    if handled is not None:
-        query += " AND r.handled = %s"
-        params.append(handled)
-    if resolved is not None:
-        query += " AND r.resolved = %s"
-        params.append(resolved)
-    if time is not None:
-        query += " AND r.created_at >= %s"
-        params.append(time)
-
-    # Add sorting and pagination
-    offset = (page - 1) * limit
-    query += " ORDER BY r.created_at DESC LIMIT %s OFFSET %s"
-    params.extend([limit, offset])
-
-    cursor.execute(query, params)
+    execute_prepared(cursor, name, query, params)
     rows = cursor.fetchall()
-    rejections = [
-        {
-            "uuid": row[0],
-            "value": row[1],
-            "created_at": row[2],
-            "project_uuid": project_uuid,
-            "handled": row[3],
-            "resolved": row[4],
-        }
-        for row in rows
-    ]
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+
+    if total_count is None and rows:
+        total_count = rows[0]["total_count"]
+        set_cached_count(count_key, total_count)
 
-    return rejections
+    issues = []
+
+    for row in rows:
+        kind = row.pop("kind")
+        del row["total_count"]
+
+        if kind == "error":
+            del row["error_hash"], row["value"]
+        else:
+            for column in ERROR_ONLY_COLUMNS:
+                del row[column]
+
+        row["project_uuid"] = project_uuid
+        issues.append(row)
+
+    return issues, total_count, has_next
 
 
 def calculate_total_error_pages(
@@ -188,55 +265,19 @@ def calculate_total_error_pages(
     project_uuid: str,
     limit: int,
     handled: Optional[bool],
-    time: Optional[str],
+    time: Optional[datetime],
     resolved: Optional[bool],
 ) -> int:
     """Calculates the total pages for combined error & rejection logs for a project."""
-    error_count_query = """
-    SELECT COUNT(*) FROM error_logs e
-    JOIN projects p ON e.project_id = p.id
-    WHERE p.uuid = %s
-    """
-
-    params = [project_uuid]
-
-    if handled is not None:
-        error_count_query += " AND e.handled = %s"
-        params.append(handled)
-    if resolved is not None:
-        error_count_query += " AND e.resolved = %s"
-        params.append(resolved)
-    if time is not None:
-        error_count_query += " AND e.created_at >= %s"
-        params.append(time)
-
-    cursor.execute(error_count_query, params)
-    error_count = cursor.fetchone()[0]
-
-    rejection_count_query = """
-    SELECT COUNT(*)
-    FROM rejection_logs r
-    JOIN projects p ON r.project_id = p.id
-    WHERE p.uuid = %s
-    """
-
-    params = [project_uuid]
-
-    # Add filters to the rejection count query
-    if handled is not None:
-        rejection_count_query += " AND r.handled = %s"
-        params.append(handled)
-    if resolved is not None:
-        rejection_count_query += " AND r.resolved = %s"
-        params.append(resolved)
-    if time is not None:
-        rejection_count_query += " AND r.created_at >= %s"
-        params.append(time)
+    filters = (project_uuid, handled, resolved, time)
+    count_key = ("issues", *filters)
+    total_count = get_cached_count(count_key)
 
-    cursor.execute(rejection_count_query, params)
-    rejection_count = cursor.fetchone()[0]
+    if total_count is None:
+        execute_prepared(cursor, "count_issues", COUNT_ISSUES_QUERY, filters)
+        total_count = cursor.fetchone()["total_count"]
+        set_cached_count(count_key, total_count)
 
-    total_count = error_count + rejection_count
-    total_pages = math.ceil(total_count / limit)
+    total_pages = count_pages(total_count, limit)
 
     return total_pages
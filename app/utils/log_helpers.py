@@ -0,0 +1,20 @@
+"""Logging helpers."""
+
+import random
+import sys
+from logging import Logger
+from flask import current_app
+
+
+def log_exception_sampled(logger: Logger, message: str, *args) -> None:
+    """Logs the exception being handled, attaching its traceback to a sample of
+    calls (`TRACEBACK_SAMPLE_RATE`). Other calls record only the exception type, so
+    a flood of failing requests does not spend its time formatting tracebacks."""
+    rate = current_app.config["TRACEBACK_SAMPLE_RATE"]
+
+    if random.random() < rate:
+        logger.error(message, *args, exc_info=True)
+    else:
+        exc_type = sys.exc_info()[0]
+        exc_name = exc_type.__name__ if exc_type else None
+        logger.error(message + " [%s]", *args, exc_name)
@@ -0,0 +1,28 @@
+"""Password hashing helpers.
+
+bcrypt spends hundreds of milliseconds of CPU per call. The API runs on gevent, so
+doing that on the request greenlet would stall every other request in the worker.
+These helpers run bcrypt on gevent's native thread pool instead; bcrypt releases the
+GIL, so the worker keeps serving other requests while a hash is computed.
+"""
+
+import bcrypt
+from gevent import get_hub
+
+
+def _hashpw(password: str) -> str:
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+
+
+def _checkpw(password: str, password_hash: str) -> bool:
+    return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+
+
+def hash_password(password: str) -> str:
+    """Hashes a password with a freshly generated salt."""
+    return get_hub().threadpool.apply(_hashpw, (password,))
+
+
+def check_password(password: str, password_hash: str) -> bool:
+    """Verifies a password against a stored bcrypt hash."""
+    return get_hub().threadpool.apply(_checkpw, (password, password_hash))
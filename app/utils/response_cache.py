@@ -0,0 +1,45 @@
+"""Response cache for idempotent GET routes.
+
+Dashboards poll some read-only routes every few seconds while the data behind them
+changes far less often. Those routes keep their serialized JSON body for a few
+seconds and tag it with an ETag, so repeated polls skip both the database and the
+serializer, and clients that send a matching `If-None-Match` get a bodyless 304.
+"""
+
+import hashlib
+from threading import RLock
+from typing import Any, Callable, Hashable
+from cachetools import TTLCache
+from flask import Response, current_app, request
+
+RESPONSE_CACHE_TTL = 10
+
+_response_cache = TTLCache(maxsize=1024, ttl=RESPONSE_CACHE_TTL)
+_response_cache_lock = RLock()
+
+
+def cached_json_response(key: Hashable, build_payload: Callable[[], Any]) -> Response:
+    """Returns the cached `{"payload": ...}` response for `key`, calling
+    `build_payload` to produce the payload on a cache miss."""
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+
+    if entry is None:
+        body = current_app.json.dumps({"payload": build_payload()}).encode("utf-8")
+        entry = (body, hashlib.md5(body).hexdigest())
+        with _response_cache_lock:
+            _response_cache[key] = entry
+
+    body, etag = entry
+    response = Response(body, status=200, mimetype="application/json")
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.max_age = RESPONSE_CACHE_TTL
+
+    return response.make_conditional(request)
+
+
+def invalidate_cached_response(key: Hashable) -> None:
+    """Drops the cached response for `key` after the data behind it changes."""
+    with _response_cache_lock:
+        _response_cache.pop(key, None)
@@ -1,6 +1,6 @@
 import uuid
 
 
-def generate_uuid() -> str:
+def generate_uuid() -> uuid.UUID:
     """Generates a new UUID."""
-    return str(uuid.uuid4())
+    return uuid.uuid4()
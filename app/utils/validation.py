@@ -1,8 +1,62 @@
 """Validation utility."""
 
 import re
+import uuid
+from datetime import datetime
+from typing import Annotated, Optional, Tuple
+from pydantic import BaseModel, Field, model_validator
 
 
 def is_valid_email(email: str) -> bool:
     """Validates an email address format."""
     return re.match(r"[^@]+@[^@]+\.[^@]+", email) is not None
+
+
+def is_valid_uuid(value: str) -> bool:
+    """Validates that a string is a UUID in canonical hyphenated form, the only
+    form accepted both here and by Postgres' uuid type."""
+    try:
+        return str(uuid.UUID(value)) == value.lower()
+    except (AttributeError, TypeError, ValueError):
+        return False
+
+
+NonEmptyStr = Annotated[str, Field(min_length=1)]
+
+
+class IssueQuery(BaseModel):
+    """Query parameters for listing a project's issues."""
+
+    # Bounded so a page never reads whole log tables and its offset stays well
+    # inside Postgres' bigint range.
+    page: int = Field(default=1, ge=1, le=100_000)
+    limit: int = Field(default=10, ge=1, le=100)
+    handled: Optional[bool] = None
+    time: Optional[datetime] = None
+    resolved: Optional[bool] = None
+    after_created_at: Optional[datetime] = None
+    after_uuid: Optional[uuid.UUID] = None
+
+    @model_validator(mode="after")
+    def check_cursor(self) -> "IssueQuery":
+        """Requires both halves of the pagination cursor, or neither."""
+        if (self.after_created_at is None) != (self.after_uuid is None):
+            raise ValueError("after_created_at and after_uuid must be given together")
+        return self
+
+    @property
+    def after(self) -> Optional[Tuple[datetime, str]]:
+        """The pagination cursor, if one was given."""
+        if self.after_uuid is None:
+            return None
+        return self.after_created_at, str(self.after_uuid)
+
+
+class CreateUserPayload(BaseModel):
+    """Request body for creating a user."""
+
+    first_name: NonEmptyStr
+    last_name: NonEmptyStr
+    email: NonEmptyStr
+    password: NonEmptyStr
+    confirmed_password: NonEmptyStr
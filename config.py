@@ -19,6 +19,10 @@ def load_config(app):
     app.config["HTTPONLY"] = os.getenv("HTTPONLY") == "True"
     app.config["SECURE"] = os.getenv("SECURE") == "True"
     app.config["SAMESITE"] = os.getenv("SAMESITE")
+    # Share of logged route failures that include a full traceback.
+    app.config["TRACEBACK_SAMPLE_RATE"] = float(
+        os.getenv("TRACEBACK_SAMPLE_RATE", "0.01")
+    )
 
     if app.config["ENVIRONMENT"] == "development":
         from dotenv import load_dotenv
@@ -1,26 +1,46 @@
 """Database configuration and connection management with pooling."""
 
 import functools
+import uuid
 from psycopg2 import pool
-from psycopg2.extensions import connection, cursor as Cursor
-from typing import Any
+from psycopg2.extensions import connection, cursor as Cursor, register_adapter
+from psycopg2.extras import RealDictCursor, UUID_adapter
+from typing import Any, Sequence
 
 connection_pool: pool.ThreadedConnectionPool = None
 
 
+class PreparedStatementConnection(connection):
+    """Connection that remembers which server-side prepared statements it holds.
+
+    Prepared statements live as long as the server session, so the registry lives
+    on the connection itself: a connection the pool discards and reopens starts
+    with an empty registry and prepares its statements again.
+    """
+
+    def __init__(self, *args: tuple, **kwargs: dict) -> None:
+        super().__init__(*args, **kwargs)
+        self.prepared_statements = set()
+
+
 def init_db_pool(app) -> None:
     """Initialize the connection pool."""
     global connection_pool
     app.logger.debug("Initialising pool")
+    # Send uuid.UUID parameters as native uuid values. Only the adapter is
+    # registered: uuid columns are still read back as strings, which is what the
+    # JWT payloads, socket rooms and JSON responses expect.
+    register_adapter(uuid.UUID, UUID_adapter)
     if connection_pool is None:
         connection_pool = pool.ThreadedConnectionPool(
-            minconn=1,
+            minconn=app.config.get("DB_MIN_CONNECTIONS", 2),
             maxconn=app.config.get("DB_MAX_CONNECTIONS", 10),
             host=app.config["DB_HOST"],
             database=app.config["DB_NAME"],
             user=app.config["DB_USER"],
             password=app.config["DB_PASSWORD"],
             port=app.config["DB_PORT"],
+            connection_factory=PreparedStatementConnection,
         )
 
 
@@ -47,14 +67,38 @@ def close_db_pool() -> None:
         connection_pool = None
 
 
-def manage_db_connection(is_write: bool) -> callable:
-    """Creates a decorator to manage a database connection."""
+def execute_prepared(
+    cursor: Cursor, name: str, query: str, params: Sequence[Any]
+) -> None:
+    """Executes `query` as the prepared statement `name`.
+
+    The statement is prepared the first time it is used on a connection, after
+    which Postgres reuses its plan instead of parsing and planning the query on
+    every call. `query` uses `$1`, `$2`, ... placeholders.
+    """
+    prepared = cursor.connection.prepared_statements
+    if name not in prepared:
+        cursor.execute(f"PREPARE {name} AS {query}")
+        prepared.add(name)
+
+    placeholders = ", ".join(["%s"] * len(params))
+    cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+
+
+def manage_db_connection(is_write: bool, cursor_factory: type = None) -> callable:
+    """Creates a decorator to manage a database connection.
+
+    Read connections run in autocommit mode, so plain SELECTs are not wrapped in
+    a BEGIN/ROLLBACK pair when the connection is handed back to the pool. Their
+    cursors return rows as dicts keyed by column name.
+    """
 
     def decorator(f: callable) -> callable:
         @functools.wraps(f)
         def wrapper(*args: tuple, **kwargs: dict) -> Any:
             connection = get_db_connection_from_pool()
-            cursor: Cursor = connection.cursor()
+            connection.autocommit = not is_write
+            cursor: Cursor = connection.cursor(cursor_factory=cursor_factory)
             try:
                 kwargs["cursor"] = cursor
                 kwargs["connection"] = connection
@@ -72,5 +116,7 @@ def manage_db_connection(is_write: bool) -> callable:
     return decorator
 
 
-db_read_connection = manage_db_connection(is_write=False)
+db_read_connection = manage_db_connection(
+    is_write=False, cursor_factory=RealDictCursor
+)
 db_write_connection = manage_db_connection(is_write=True)
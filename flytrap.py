@@ -10,14 +10,35 @@ Attributes:
 
 import logging
 import atexit
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from app import create_app, socketio
 from config import load_config
 from db import init_db_pool, close_db_pool
 
-logging.basicConfig(
-    level=logging.INFO,  # Default to INFO for initial setup
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+
+class DeferredFormatQueueHandler(QueueHandler):
+    """Enqueues records as they are, leaving message and traceback formatting to
+    the listener's handler. The stock `prepare` formats on the calling thread so
+    records can be pickled, which an in-process queue does not need."""
+
+    def prepare(self, record):
+        return record
+
+
+# Request handlers only enqueue log records; a background listener formats them and
+# writes them to the stream.
+log_queue = queue.SimpleQueue()
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s")
 )
+log_listener = QueueListener(log_queue, stream_handler)
+log_listener.start()
+
+root_logger = logging.getLogger()
+root_logger.setLevel(logging.INFO)  # Default to INFO for initial setup
+root_logger.addHandler(DeferredFormatQueueHandler(log_queue))
 logger = logging.getLogger(__name__)
 
 app = create_app()
@@ -32,6 +53,7 @@ else:
     app.logger.setLevel(logging.INFO)
 
 atexit.register(close_db_pool)
+atexit.register(log_listener.stop)
 
 if __name__ == "__main__":
     socketio.run(app, host="0.0.0.0", port=5001, debug=True)
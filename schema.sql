@@ -6,18 +6,18 @@ DROP TABLE IF EXISTS users;
 
 CREATE TABLE projects (
   id SERIAL PRIMARY KEY,
-  uuid VARCHAR(36) NOT NULL UNIQUE,
+  uuid UUID NOT NULL UNIQUE,
   name VARCHAR(255) NOT NULL,
   api_key VARCHAR(36) NOT NULL UNIQUE,
   platform VARCHAR(255) NOT NULL,
   sns_topic_arn VARCHAR(255) NOT NULL
 );
 
-CREATE INDEX idx_project_uuid ON projects(uuid);
+CREATE INDEX idx_project_name_uuid ON projects(name, uuid);
 
 CREATE TABLE error_logs (
     id SERIAL PRIMARY KEY,
-    uuid VARCHAR(36) NOT NULL UNIQUE,
+    uuid UUID NOT NULL UNIQUE,
     name VARCHAR(255) NOT NULL,
     message TEXT NOT NULL,
     created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
@@ -38,11 +38,13 @@ CREATE TABLE error_logs (
     error_hash VARCHAR(64)
 );
 
-CREATE INDEX idx_error_log_uuid ON error_logs(uuid); 
+CREATE INDEX idx_error_log_project_created ON error_logs(project_id, created_at DESC, uuid DESC)
+  INCLUDE (handled, resolved);
+CREATE INDEX idx_error_log_project_hash ON error_logs(project_id, error_hash) INCLUDE (ip);
 
 CREATE TABLE rejection_logs (
   id SERIAL PRIMARY KEY,
-  uuid VARCHAR(36) NOT NULL UNIQUE,
+  uuid UUID NOT NULL UNIQUE,
   value TEXT NOT NULL,
   created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
   project_id INT REFERENCES projects(id) ON DELETE CASCADE,
@@ -56,11 +58,12 @@ CREATE TABLE rejection_logs (
   runtime VARCHAR(255)
 );
 
-CREATE INDEX idx_rejection_log_uuid ON rejection_logs(uuid);
+CREATE INDEX idx_rejection_log_project_created ON rejection_logs(project_id, created_at DESC, uuid DESC)
+  INCLUDE (handled, resolved);
 
 CREATE TABLE users (
     id SERIAL PRIMARY KEY,
-    uuid VARCHAR(36) NOT NULL UNIQUE,
+    uuid UUID NOT NULL UNIQUE,
     first_name VARCHAR(255) NOT NULL,
     last_name VARCHAR(255) NOT NULL,
     email VARCHAR(255) UNIQUE NOT NULL,
@@ -69,8 +72,6 @@ CREATE TABLE users (
     created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE INDEX idx_user_uuid ON users(uuid); 
-
 CREATE TABLE projects_users (
   id SERIAL PRIMARY KEY,
   project_id INT REFERENCES projects(id) ON DELETE CASCADE,
@@ -79,9 +80,11 @@ CREATE TABLE projects_users (
   UNIQUE (project_id, user_id)
 );
 
+CREATE INDEX idx_projects_users_user_project ON projects_users(user_id, project_id);
+
 INSERT INTO users (uuid, first_name, last_name, email, password_hash, is_root)
 VALUES (
-  'root-uuid-123-456-789',
+  '00000000-0000-0000-0000-000000000001',
   'Flytrap',
   'Admin',
   'admin@admin.com',